@@ -12,7 +12,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "tests"))
 from example_test_data import TestDataCategories
 
 import webextract
-from webextract import Extractor
+
+# One extractor shared by all examples so the LLM client is only created once
+_EXTRACTOR = None
+
+
+def get_extractor():
+    """Return the shared WebExtractor, creating it on first use"""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = webextract.WebExtractor()
+    return _EXTRACTOR
 
 
 async def example_basic_url_extraction():
@@ -22,12 +32,12 @@ async def example_basic_url_extraction():
 
     # Use reliable test URL instead of hardcoded URL
     test_urls = TestDataCategories.get_content_types()
-    extractor = Extractor()
-    result = await extractor.extract(test_urls["news"], {"summary": "Brief summary of the page"})
-    print(f"Summary: {result.get('summary', 'N/A')}")
+    extractor = get_extractor()
+    result = extractor.extract(test_urls["news"], {"summary": "Brief summary of the page"})
+    print(f"Summary: {result.structured_info.get('summary', 'N/A')}")
 
 
-async def example_batch_processing():
+async def example_batch_processing(max_concurrency: int = 8):
     """Batch processing example"""
     print("\n🔹 Batch Processing")
     print("-" * 18)
@@ -36,12 +46,23 @@ async def example_batch_processing():
     urls = TestDataCategories.get_batch_urls(2)
     schema = {"title": "Page title", "description": "Brief description"}
 
-    extractor = Extractor()
-    results = await extractor.extract_batch(urls, schema)
+    extractor = get_extractor()
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def extract_one(url):
+        # extract() is blocking, so run it in the default thread pool
+        async with semaphore:
+            return await loop.run_in_executor(None, extractor.extract, url, schema)
+
+    results = await asyncio.gather(*(extract_one(url) for url in urls), return_exceptions=True)
 
     print(f"Processed {len(results)} URLs")
     for i, result in enumerate(results):
-        print(f"URL {i+1}: {result.get('title', 'N/A')}")
+        if isinstance(result, Exception):
+            print(f"URL {i+1}: failed ({result})")
+        else:
+            print(f"URL {i+1}: {result.structured_info.get('title', 'N/A')}")
 
 
 async def example_custom_schema():
@@ -57,11 +78,11 @@ async def example_custom_schema():
 
     # Use reliable test URL
     test_urls = TestDataCategories.get_content_types()
-    extractor = Extractor()
-    result = await extractor.extract(test_urls["blog"], schema)
+    extractor = get_extractor()
+    result = extractor.extract(test_urls["blog"], schema)
 
-    print(f"Title: {result.get('title', 'N/A')}")
-    print(f"Topic: {result.get('main_topic', 'N/A')}")
+    print(f"Title: {result.structured_info.get('title', 'N/A')}")
+    print(f"Topic: {result.structured_info.get('main_topic', 'N/A')}")
 
 
 async def example_chunked_extraction():
@@ -71,8 +92,8 @@ async def example_chunked_extraction():
 
     # Use reliable test URL for large content testing
     test_urls = TestDataCategories.get_edge_cases()
-    extractor = Extractor()
-    result = await extractor.extract(
+    extractor = get_extractor()
+    result = extractor.extract(
         test_urls["large_content"],
         {
             "summary": "Brief summary of AI",
@@ -80,8 +101,8 @@ async def example_chunked_extraction():
         },
     )
 
-    print(f"AI Summary: {result.get('summary', 'N/A')}")
-    print(f"History: {result.get('history', 'N/A')}")
+    print(f"AI Summary: {result.structured_info.get('summary', 'N/A')}")
+    print(f"History: {result.structured_info.get('history', 'N/A')}")
 
 
 def basic_sync_example():
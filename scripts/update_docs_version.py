@@ -7,35 +7,83 @@ This script is run automatically by GitHub Actions on releases.
 
 import json
 import re
+import shlex
 import subprocess
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PYPI_BADGE_RE = re.compile(
+    r"\[!\[PyPI version\]\(https://badge\.fury\.io/py/llm-webextract\.svg\)\]"
+    r"\(https://badge\.fury\.io/py/llm-webextract\)"
+)
+VERSION_INFO_RE = re.compile(r"<!-- Version Info:.*?-->")
+API_VERSION_RE = re.compile(r"> \*\*Version:\*\*.*?\n\n", re.DOTALL)
+PYPROJECT_VERSION_RE = re.compile(r'^version\s*=\s*["\'](.+?)["\']', re.M)
+
 
 def run_command(cmd):
-    """Run a shell command and return the output."""
+    """Run a command without a shell and return the output."""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
+        result = subprocess.run(shlex.split(cmd), capture_output=True, text=True, check=True)
         return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"Error running command '{cmd}': {e}")
         return None
 
 
+def write_if_changed(path, content):
+    """Write text to path only if it differs from what is on disk.
+
+    Returns True if the file was written.
+    """
+    new = content.encode("utf-8")
+    if path.exists() and path.read_bytes() == new:
+        return False
+    path.write_bytes(new)
+    return True
+
+
 def get_version_info():
     """Get version information from git and package."""
     info = {}
 
-    # Get package version
+    # Get package version from installed metadata; importing webextract would
+    # pull in the scraper and LLM clients just to read one string
     try:
-        import webextract
+        from importlib.metadata import PackageNotFoundError, version
+
+        info["package_version"] = version("llm-webextract")
+    except (ImportError, PackageNotFoundError):
+        pyproject = Path("pyproject.toml")
+        match = pyproject.exists() and PYPROJECT_VERSION_RE.search(pyproject.read_text())
+        info["package_version"] = match.group(1) if match else "dev"
+
+    # Get commit info (full sha, short sha and date) in a single git call
+    head = run_command("git log -1 --format='%H %h %cd' --date=short")
+    head_sha, info["commit_sha"], info["commit_date"] = (
+        head.split(" ", 2) if head else (None, None, None)
+    )
+    info["commit_datetime"] = datetime.now().isoformat()
 
-        info["package_version"] = webextract.__version__
-    except ImportError:
-        info["package_version"] = "dev"
+    # Get all tags with the commit they point to; annotated tags are peeled via %(*objectname)
+    tag_refs = run_command(
+        "git for-each-ref --sort=-version:refname "
+        "--format='%(refname:short) %(objectname) %(*objectname)' refs/tags"
+    )
+    all_versions = []
+    git_tag = None
+    for line in tag_refs.splitlines() if tag_refs else []:
+        name, *shas = line.split()
+        all_versions.append(name)
+        if git_tag is None and head_sha in shas:
+            git_tag = name
+    info["all_versions"] = all_versions
 
-    # Get git tag
-    git_tag = run_command("git describe --tags --exact-match 2>/dev/null")
     if git_tag:
         info["git_tag"] = git_tag
         info["is_release"] = True
@@ -43,15 +91,6 @@ def get_version_info():
         info["git_tag"] = "main"
         info["is_release"] = False
 
-    # Get commit info
-    info["commit_sha"] = run_command("git rev-parse --short HEAD")
-    info["commit_date"] = run_command("git log -1 --format=%cd --date=short")
-    info["commit_datetime"] = datetime.now().isoformat()
-
-    # Get all tags for version history
-    all_tags = run_command("git tag --sort=-version:refname")
-    info["all_versions"] = all_tags.split("\n") if all_tags else []
-
     return info
 
 
@@ -65,15 +104,11 @@ def update_readme_badges(info):
     content = readme_path.read_text()
 
     # Update PyPI version badge
-    pypi_pattern = (
-        r"\[!\[PyPI version\]\(https://badge\.fury\.io/py/llm-webextract\.svg\)\]"
-        r"\(https://badge\.fury\.io/py/llm-webextract\)"
-    )
     pypi_replacement = (
         f"[![PyPI version](https://badge.fury.io/py/llm-webextract.svg)]"
         f'(https://pypi.org/project/llm-webextract/{info["package_version"]}/)'
     )
-    content = re.sub(pypi_pattern, pypi_replacement, content)
+    content = PYPI_BADGE_RE.sub(pypi_replacement, content)
 
     # Add version info to the top
     version_info = (
@@ -88,10 +123,12 @@ def update_readme_badges(info):
         content = "\n".join(lines)
     else:
         # Update existing version info
-        content = re.sub(r"<!-- Version Info:.*?-->", version_info.strip(), content)
+        content = VERSION_INFO_RE.sub(version_info.strip(), content)
 
-    readme_path.write_text(content)
-    print(f"✅ Updated README.md with version {info['package_version']}")
+    if write_if_changed(readme_path, content):
+        print(f"✅ Updated README.md with version {info['package_version']}")
+    else:
+        print("README.md already up to date")
 
 
 def create_version_json(info):
@@ -118,7 +155,22 @@ def create_version_json(info):
     docs_dir.mkdir(exist_ok=True)
 
     version_file = docs_dir / "version.json"
-    version_file.write_text(json.dumps(version_data, indent=2))
+
+    # Skip rewriting when only the timestamp would change
+    if version_file.exists():
+        try:
+            previous = json.loads(version_file.read_text())
+            previous.pop("updated_at", None)
+            if previous == {k: v for k, v in version_data.items() if k != "updated_at"}:
+                print(f"{version_file} already up to date")
+                return version_data
+        except ValueError:
+            pass
+
+    if orjson is not None:
+        version_file.write_bytes(orjson.dumps(version_data, option=orjson.OPT_INDENT_2))
+    else:
+        version_file.write_text(json.dumps(version_data, indent=2))
     print(f"✅ Created {version_file} with version information")
 
     return version_data
@@ -149,10 +201,12 @@ def update_api_reference(info):
         content = "\n".join(lines)
     else:
         # Update existing version info
-        content = re.sub(r"> \*\*Version:\*\*.*?\n\n", version_header, content, flags=re.DOTALL)
+        content = API_VERSION_RE.sub(version_header, content)
 
-    api_ref_path.write_text(content)
-    print(f"✅ Updated API_REFERENCE.md with version {info['package_version']}")
+    if write_if_changed(api_ref_path, content):
+        print(f"✅ Updated API_REFERENCE.md with version {info['package_version']}")
+    else:
+        print("API_REFERENCE.md already up to date")
 
 
 def create_changelog_link(info):
@@ -164,8 +218,10 @@ def create_changelog_link(info):
 
     if changelog_source.exists():
         # Copy changelog to docs directory
-        changelog_dest.write_text(changelog_source.read_text())
-        print(f"✅ Copied CHANGELOG.md to {changelog_dest}")
+        if write_if_changed(changelog_dest, changelog_source.read_text()):
+            print(f"✅ Copied CHANGELOG.md to {changelog_dest}")
+        else:
+            print(f"{changelog_dest} already up to date")
 
 
 def main():
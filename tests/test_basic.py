@@ -91,3 +91,254 @@ def test_import_structure():
 
     assert WebExtractor is not None
     assert ExtractedContent is not None
+
+
+def _stub_extractor():
+    """Create a WebExtractor whose scraping and LLM calls are stubbed out."""
+    from webextract.core.models import ExtractedContent
+
+    extractor = WebExtractor()
+    extractor.llm_client = Mock()
+    extractor.llm_client.is_model_available.return_value = True
+    extractor._scrape_content = Mock(
+        return_value=ExtractedContent(title="Title", main_content="word " * 300)
+    )
+    extractor._process_with_llm = Mock(
+        return_value={"summary": "A sufficiently long summary of the page.", "topics": ["x"]}
+    )
+    return extractor
+
+
+def test_extraction_cache_keyed_by_schema():
+    """Cached results are reused per URL and schema, and bypassed by force_refresh."""
+    extractor = _stub_extractor()
+
+    first = extractor.extract("https://example.com")
+    assert extractor.extract("https://example.com") is first
+    assert extractor._scrape_content.call_count == 1
+
+    extractor.extract("https://example.com", schema={"price": "Product price"})
+    assert extractor._scrape_content.call_count == 2
+
+    extractor.extract("https://example.com", force_refresh=True)
+    assert extractor._scrape_content.call_count == 3
+
+
+def test_extract_batch_preserves_order():
+    """Threaded batch extraction returns results in input order."""
+    extractor = _stub_extractor()
+    urls = [f"https://example.com/{i}" for i in range(5)]
+
+    results = extractor.extract_batch(urls, max_workers=2)
+
+    assert [r.url for r in results] == urls
+
+
+def test_aextract_batch_preserves_order():
+    """Async batch extraction returns results in input order from one extractor."""
+    extractor = _stub_extractor()
+    urls = [f"https://example.com/{i}" for i in range(5)]
+
+    results = asyncio.run(extractor.aextract_batch(urls, concurrency=2))
+
+    assert [r.url for r in results] == urls
+    assert extractor._scrape_content.call_count == len(urls)
+
+
+def test_llm_cache_reused_across_extractors(tmp_path):
+    """Deterministic results are served from the on-disk LLM cache."""
+    from webextract.core.cache import LLMCache
+
+    config = webextract.ConfigBuilder().with_temperature(0).with_cache(str(tmp_path)).build()
+    first = _stub_extractor()
+    first.config = config
+    first.llm_cache = LLMCache(tmp_path)
+    result = first.extract("https://example.com")
+
+    second = _stub_extractor()
+    second.config = config
+    second.llm_cache = LLMCache(tmp_path)
+    cached = second.extract("https://example.com")
+
+    assert second._scrape_content.call_count == 0
+    assert cached.get_summary() == result.get_summary()
+    assert second.llm_cache.stats()["hits"] == 1
+
+
+def test_config_manager_round_trip(tmp_path):
+    """Saved configs load back, and CLI overrides leave the base config untouched."""
+    from webextract.cli.config_manager import ConfigManager
+
+    manager = ConfigManager(str(tmp_path / "config.json"))
+    base = webextract.ConfigBuilder().with_model("qwen2.5").build()
+
+    updated = manager.update_config_from_cli(base, model="llama3.2", max_content=5000)
+    assert base.llm.model_name == "qwen2.5"
+    assert updated.llm.model_name == "llama3.2"
+    assert updated.scraping.max_content_length == 5000
+
+    manager.save_config(updated)
+    loaded = manager.load_config()
+    assert loaded.llm.model_name == "llama3.2"
+    assert loaded.scraping.max_content_length == 5000
+
+
+def _run_coalesced(call, callers=4):
+    """Run call through one LLMBatcher from several threads with an identical request."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from webextract.core.batcher import LLMBatcher
+
+    batcher = LLMBatcher()
+    release = threading.Event()
+
+    def blocking_call():
+        release.wait(5)
+        return call()
+
+    def request():
+        return batcher.run(blocking_call, content="page", prompt="extract")
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        futures = [pool.submit(request) for _ in range(callers)]
+        deadline = time.monotonic() + 5
+        while batcher.coalesced < callers - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append(e)
+
+    return batcher, outcomes
+
+
+def test_batcher_coalesces_identical_requests():
+    """Concurrent identical requests share one backend call and get independent copies."""
+    calls = []
+
+    def call():
+        calls.append(1)
+        return {"summary": "shared", "topics": ["a"]}
+
+    batcher, results = _run_coalesced(call)
+
+    assert len(calls) == 1
+    assert batcher.coalesced == 3
+    assert all(result == {"summary": "shared", "topics": ["a"]} for result in results)
+    assert len({id(result["topics"]) for result in results}) == len(results)
+
+    results[0]["topics"].append("changed")
+    assert all(result["topics"] == ["a"] for result in results[1:])
+
+
+def test_batcher_propagates_errors_to_all_waiters():
+    """A failing call raises in every coalesced caller and leaves nothing in flight."""
+
+    def call():
+        raise ValueError("provider failed")
+
+    batcher, outcomes = _run_coalesced(call)
+
+    assert batcher.coalesced == 3
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert batcher._inflight == {}
+
+
+def test_confidence_scorer_config_assignment_rebinds_weights():
+    """Assigning a new config to a scorer changes the weights it scores with."""
+    from dataclasses import replace
+
+    from webextract.core.confidence_scorer import ConfidenceScorer
+    from webextract.core.models import ExtractedContent
+
+    content = ExtractedContent(title="Title", main_content="word " * 300)
+    info = {"summary": "A sufficiently long summary of the page."}
+    scorer = ConfidenceScorer()
+    before = scorer.calculate_confidence(content, info)
+
+    scorer.config = replace(scorer.config, title_weight=0.0)
+
+    assert abs(scorer.calculate_confidence(content, info) - (before - 0.1)) < 1e-9
+
+
+def test_adaptive_scorer_stats_match_recomputation_after_wraparound():
+    """Running feedback statistics match a direct computation over the window."""
+    import random
+
+    from webextract.core.confidence_scorer import AdaptiveConfidenceScorer
+
+    rng = random.Random(7)
+    scorer = AdaptiveConfidenceScorer()
+    pairs = [(rng.random(), rng.random()) for _ in range(2 * scorer.history_size + 37)]
+    for predicted, actual in pairs:
+        scorer.add_feedback(predicted, actual)
+
+    window = pairs[-scorer.history_size :]
+    n = len(window)
+    xs = [p for p, _ in window]
+    ys = [a for _, a in window]
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in window)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+
+    stats = scorer.get_calibration_stats()
+    assert abs(stats["mean_predicted"] - mean_x) < 1e-12
+    assert abs(stats["mean_actual"] - mean_y) < 1e-12
+    assert abs(stats["mean_error"] - sum(abs(x - y) for x, y in window) / n) < 1e-12
+    assert abs(stats["correlation"] - cov / (var_x * var_y) ** 0.5) < 1e-12
+    assert [(e["predicted"], e["actual"]) for e in scorer.feedback_history] == window
+
+    scorer.feedback_history = [{"predicted": 0.2, "actual": 0.4}, {"predicted": 0.6, "actual": 0.8}]
+    assert abs(scorer.get_average_error() - 0.2) < 1e-12
+    assert abs(scorer.get_calibration_stats()["correlation"] - 1.0) < 1e-12
+
+
+def test_flatten_dict_nested_lists_and_non_str_keys():
+    """CSV flattening joins nested keys depth-first and stringifies non-str keys."""
+    from rich.console import Console
+
+    from webextract.cli.output_formatter import OutputFormatter
+
+    data = {
+        "a": {"b": 1, 2: {"c": "x"}},
+        "items": [{"k": 1}, "plain", {"n": {"m": 2}}],
+        "tags": ["t1", "t2"],
+        3: None,
+    }
+
+    flattened = OutputFormatter(Console())._flatten_dict(data)
+
+    assert list(flattened.items()) == [
+        ("a.b", 1),
+        ("a.2.c", "x"),
+        ("items[0].k", 1),
+        ("items[1]", "plain"),
+        ("items[2].n.m", 2),
+        ("tags", ["t1", "t2"]),
+        ("3", None),
+    ]
+
+
+def test_config_manager_save_keeps_file_mode(tmp_path):
+    """Saving over an existing config keeps its permissions and leaves no temp files."""
+    import os
+    import stat
+
+    from webextract.cli.config_manager import ConfigManager
+
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(str(config_path))
+    manager.save_config(webextract.ConfigBuilder().build())
+    os.chmod(config_path, 0o600)
+
+    manager.save_config(webextract.ConfigBuilder().with_openai("sk-test").build())
+
+    assert stat.S_IMODE(config_path.stat().st_mode) == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
@@ -1,47 +1,108 @@
 """LLM WebExtract - AI-powered web content extraction using LLMs.
 
-This module provides clean, direct imports with excellent IDE support,
-immediate error feedback, and proper type hints.
+This module provides the public API with proper type hints. Core classes
+are imported on first use so that importing the package stays cheap.
 """
 
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ImportError:  # pragma: no cover - for Python <3.10
-    from importlib_metadata import version, PackageNotFoundError
+import re
+from dataclasses import fields, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-try:
-    __version__ = version("llm-webextract")
-except PackageNotFoundError:
-    # Package is not installed, read version from pyproject.toml
-    from pathlib import Path
-    import re
+from .config.profiles import ConfigProfiles
+from .config.settings import ConfigBuilder, LLMConfig, ScrapingConfig, WebExtractConfig
+
+_VERSION_RE = re.compile(rb'^version\s*=\s*["\'](.+?)["\']', re.M)
+
+# Option names _quick_config applies to each section; LLM fields take precedence
+_LLM_FIELDS = frozenset(f.name for f in fields(LLMConfig))
+_SCRAPING_FIELDS = frozenset(f.name for f in fields(ScrapingConfig)) - _LLM_FIELDS
+
+
+@lru_cache(maxsize=None)
+def _get_version() -> str:
+    """Get the installed package version, falling back to pyproject.toml."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover - for Python <3.10
+        from importlib_metadata import PackageNotFoundError, version
 
     try:
-        root = Path(__file__).resolve().parents[1]
-        pyproject = root / "pyproject.toml"
-        version_pattern = re.compile(r'^version\s*=\s*["\'](.+?)["\']', re.M)
-        text = pyproject.read_text()
-        match = version_pattern.search(text)
-        __version__ = match.group(1) if match else "0.0.0"
+        return version("llm-webextract")
+    except PackageNotFoundError:
+        pass
+
+    # Package is not installed, read version from pyproject.toml
+    try:
+        pyproject = Path(__file__).resolve().parents[1] / "pyproject.toml"
+        match = _VERSION_RE.search(pyproject.read_bytes())
+        return match.group(1).decode("utf-8") if match else "0.0.0"
     except Exception:  # pragma: no cover - fallback
-        __version__ = "0.0.0"
+        return "0.0.0"
+
 
 __author__ = "Himasha Herath"
 __description__ = "AI-powered web content extraction with Large Language Models"
 
-# Direct imports for better IDE support and immediate error feedback
-from .config.profiles import ConfigProfiles
-from .config.settings import ConfigBuilder, LLMConfig, ScrapingConfig, WebExtractConfig
-from .core.exceptions import (
-    AuthenticationError,
-    ConfigurationError,
-    ExtractionError,
-    LLMError,
-    ScrapingError,
-    WebExtractError,
-)
-from .core.extractor import DataExtractor as WebExtractor
-from .core.models import ExtractedContent, ExtractionConfig, StructuredData
+if TYPE_CHECKING:
+    from .core.exceptions import (
+        AuthenticationError,
+        ConfigurationError,
+        ExtractionError,
+        LLMError,
+        ScrapingError,
+        WebExtractError,
+    )
+    from .core.extractor import DataExtractor as WebExtractor
+    from .core.models import ExtractedContent, ExtractionConfig, StructuredData
+
+# Core names are imported on first access (PEP 562) so that reading the
+# version or building a config does not load the scraper and LLM clients
+_LAZY = {
+    "WebExtractor": ("webextract.core.extractor", "DataExtractor"),
+    "StructuredData": ("webextract.core.models", "StructuredData"),
+    "ExtractedContent": ("webextract.core.models", "ExtractedContent"),
+    "ExtractionConfig": ("webextract.core.models", "ExtractionConfig"),
+    "WebExtractError": ("webextract.core.exceptions", "WebExtractError"),
+    "ExtractionError": ("webextract.core.exceptions", "ExtractionError"),
+    "ScrapingError": ("webextract.core.exceptions", "ScrapingError"),
+    "LLMError": ("webextract.core.exceptions", "LLMError"),
+    "ConfigurationError": ("webextract.core.exceptions", "ConfigurationError"),
+    "AuthenticationError": ("webextract.core.exceptions", "AuthenticationError"),
+}
+
+
+def __getattr__(name: str):
+    """Import lazily exported names on first access."""
+    if name == "__version__":
+        # Resolved on first access; most CLI commands never need it
+        value = globals()[name] = _get_version()
+        return value
+
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily exported names in dir()."""
+    return sorted(set(globals()) | set(_LAZY) | {"__version__"})
+
+
+def _create_extractor(config: WebExtractConfig) -> "WebExtractor":
+    """Create an extractor, importing the core package on demand."""
+    from .core.extractor import DataExtractor
+
+    return DataExtractor(config)
+
 
 # Public API
 __all__ = [
@@ -68,10 +129,31 @@ __all__ = [
     "extract_with_openai",
     "extract_with_anthropic",
     "extract_with_ollama",
+    "aquick_extract",
+    "aextract_with_openai",
+    "aextract_with_anthropic",
+    "aextract_with_ollama",
+    "extract_many",
 ]
 
 
-def quick_extract(url: str, model: str = "llama3.2", **kwargs) -> StructuredData:
+def _quick_config(model: str, **kwargs) -> WebExtractConfig:
+    """Build the configuration used by :func:`quick_extract` and friends."""
+    config = ConfigBuilder().with_model(model).build()
+    if not kwargs:
+        return config
+
+    # Apply additional configuration options
+    llm_options = {k: v for k, v in kwargs.items() if k in _LLM_FIELDS}
+    scraping_options = {k: v for k, v in kwargs.items() if k in _SCRAPING_FIELDS}
+    return replace(
+        config,
+        llm=replace(config.llm, **llm_options),
+        scraping=replace(config.scraping, **scraping_options),
+    )
+
+
+def quick_extract(url: str, model: str = "llama3.2", **kwargs) -> "StructuredData":
     """Quick extraction with minimal configuration.
 
     Args:
@@ -91,23 +173,13 @@ def quick_extract(url: str, model: str = "llama3.2", **kwargs) -> StructuredData
         >>> result = quick_extract("https://example.com")
         >>> print(result.content.title)
     """
-    config = ConfigBuilder().with_model(model).build()
-
-    # Apply additional configuration options
-    if kwargs:
-        for key, value in kwargs.items():
-            if hasattr(config.llm, key):
-                setattr(config.llm, key, value)
-            elif hasattr(config.scraping, key):
-                setattr(config.scraping, key, value)
-
-    extractor = WebExtractor(config)
+    extractor = _create_extractor(_quick_config(model, **kwargs))
     return extractor.extract(url)
 
 
 def extract_with_openai(
     url: str, api_key: str, model: str = "gpt-4o-mini", **kwargs
-) -> StructuredData:
+) -> "StructuredData":
     """Quick extraction using OpenAI models.
 
     Args:
@@ -129,13 +201,13 @@ def extract_with_openai(
         >>> print(result.structured_info.get("summary"))
     """
     config = ConfigBuilder().with_openai(api_key, model).build()
-    extractor = WebExtractor(config)
+    extractor = _create_extractor(config)
     return extractor.extract(url)
 
 
 def extract_with_anthropic(
     url: str, api_key: str, model: str = "claude-3-5-sonnet-20241022", **kwargs
-) -> StructuredData:
+) -> "StructuredData":
     """Quick extraction using Anthropic Claude models.
 
     Args:
@@ -157,13 +229,13 @@ def extract_with_anthropic(
         >>> print(result.confidence)
     """
     config = ConfigBuilder().with_anthropic(api_key, model).build()
-    extractor = WebExtractor(config)
+    extractor = _create_extractor(config)
     return extractor.extract(url)
 
 
 def extract_with_ollama(
     url: str, model: str = "llama3.2", base_url: str = "http://localhost:11434", **kwargs
-) -> StructuredData:
+) -> "StructuredData":
     """Quick extraction using Ollama models.
 
     Args:
@@ -185,5 +257,65 @@ def extract_with_ollama(
         >>> print(result.content.main_content[:100])
     """
     config = ConfigBuilder().with_ollama(model, base_url).build()
-    extractor = WebExtractor(config)
+    extractor = _create_extractor(config)
     return extractor.extract(url)
+
+
+async def aquick_extract(url: str, model: str = "llama3.2", **kwargs) -> "StructuredData":
+    """Asynchronous variant of :func:`quick_extract`.
+
+    Example:
+        >>> result = await aquick_extract("https://example.com")
+    """
+    extractor = _create_extractor(_quick_config(model, **kwargs))
+    return await extractor.aextract(url)
+
+
+async def aextract_with_openai(
+    url: str, api_key: str, model: str = "gpt-4o-mini", **kwargs
+) -> "StructuredData":
+    """Asynchronous variant of :func:`extract_with_openai`."""
+    config = ConfigBuilder().with_openai(api_key, model).build()
+    return await _create_extractor(config).aextract(url)
+
+
+async def aextract_with_anthropic(
+    url: str, api_key: str, model: str = "claude-3-5-sonnet-20241022", **kwargs
+) -> "StructuredData":
+    """Asynchronous variant of :func:`extract_with_anthropic`."""
+    config = ConfigBuilder().with_anthropic(api_key, model).build()
+    return await _create_extractor(config).aextract(url)
+
+
+async def aextract_with_ollama(
+    url: str, model: str = "llama3.2", base_url: str = "http://localhost:11434", **kwargs
+) -> "StructuredData":
+    """Asynchronous variant of :func:`extract_with_ollama`."""
+    config = ConfigBuilder().with_ollama(model, base_url).build()
+    return await _create_extractor(config).aextract(url)
+
+
+async def extract_many(
+    urls: List[str],
+    model: str = "llama3.2",
+    concurrency: int = 8,
+    config: Optional[WebExtractConfig] = None,
+    **kwargs,
+) -> List[Optional["StructuredData"]]:
+    """Extract several URLs concurrently with a single shared extractor.
+
+    Args:
+        urls: URLs to extract from
+        model: LLM model name to use when no config is given (default: llama3.2)
+        concurrency: Maximum number of extractions in flight at once (default: 8)
+        config: Optional full configuration, e.g. for OpenAI or Anthropic
+        **kwargs: Additional configuration options (ignored when config is given)
+
+    Returns:
+        List of StructuredData objects in input order (None for failed extractions)
+
+    Example:
+        >>> results = await extract_many(["https://a.com", "https://b.com"])
+    """
+    extractor = _create_extractor(config or _quick_config(model, **kwargs))
+    return await extractor.aextract_batch(urls, concurrency=concurrency)
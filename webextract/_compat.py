@@ -0,0 +1,9 @@
+"""Compatibility helpers for the supported Python versions."""
+
+import sys
+from typing import Any, Dict
+
+# Configs are immutable (and hashable); __slots__ needs Python 3.10+
+DATACLASS_OPTIONS: Dict[str, Any] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    DATACLASS_OPTIONS["slots"] = True
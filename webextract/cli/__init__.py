@@ -1,5 +1,12 @@
 """CLI module for LLM WebExtract."""
 
-from .main import app, console, main
+from .main import app, get_console, main
 
-__all__ = ["app", "main", "console"]
+__all__ = ["app", "main", "console", "get_console"]
+
+
+def __getattr__(name: str):
+    """Provide the lazily created ``console`` as a package attribute."""
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,11 @@
 """CLI command implementations."""
 
 import logging
-from typing import Optional
+import os
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
+from typing import TYPE_CHECKING, List, Optional
 
-import typer
-from rich.console import Console
-
-from ..core.extractor import DataExtractor
 from .config_manager import ConfigManager, EnvironmentManager
 from .constants import PROGRESS_MESSAGES, SUCCESS_MESSAGES
 from .error_handler import ErrorHandler, RetryHandler
@@ -14,16 +13,78 @@ from .exceptions import CLIConnectionError, CLIExtractionError, CLIValidationErr
 from .output_formatter import OutputFormatter, ProgressTracker
 from .validators import InputValidator
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..config.settings import WebExtractConfig
+    from ..core.extractor import DataExtractor
+    from ..core.models import StructuredData
+
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_LOG_MAX_BYTES = 10_000_000
+_LOG_BACKUP_COUNT = 3
+
+# Handlers attached by _configure_logging, replaced when the log file changes
+_log_handlers: List[logging.Handler] = []
+
+
+def _configure_logging(level: int, log_file: str) -> None:
+    """Configure root logging idempotently.
+
+    Repeated calls only update the level; handlers are attached once per log
+    file instead of stacking a new file handle and console handler each time.
+    """
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    log_path = os.path.abspath(log_file)
+    if _log_handlers and _log_handlers[0].baseFilename == log_path:
+        return
+
+    for handler in _log_handlers:
+        root.removeHandler(handler)
+        handler.close()
+    _log_handlers.clear()
+
+    formatter = logging.Formatter(_LOG_FORMAT)
+    file_handler = RotatingFileHandler(
+        log_path, maxBytes=_LOG_MAX_BYTES, backupCount=_LOG_BACKUP_COUNT, delay=True
+    )
+    for handler in (file_handler, logging.StreamHandler()):
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+        _log_handlers.append(handler)
+
+
+# The helpers below hold no per-invocation state, so commands share one
+# instance per console instead of rebuilding them for every command object
+@lru_cache(maxsize=1)
+def _validator() -> InputValidator:
+    """Return the shared input validator."""
+    return InputValidator()
+
+
+@lru_cache(maxsize=4)
+def _output_formatter(console: "Console") -> OutputFormatter:
+    """Return the shared output formatter for a console."""
+    return OutputFormatter(console)
+
+
+@lru_cache(maxsize=8)
+def _error_handler(console: "Console", verbose: bool = False) -> ErrorHandler:
+    """Return the shared error handler for a console and verbosity."""
+    return ErrorHandler(console, verbose=verbose)
+
 
 class ExtractCommand:
     """Handle the extract command."""
 
-    def __init__(self, console: Console):
+    def __init__(self, console: "Console"):
         self.console = console
         self.config_manager = ConfigManager()
-        self.error_handler = ErrorHandler(console)
-        self.output_formatter = OutputFormatter(console)
-        self.validator = InputValidator()
+        self.error_handler = _error_handler(console)
+        self.output_formatter = _output_formatter(console)
+        self.validator = _validator()
 
     def execute(
         self,
@@ -60,11 +121,16 @@ class ExtractCommand:
             # Display info
             self._display_extraction_info(url, config, summary, verbose)
 
+            # One extractor serves both the connection test and the extraction
+            from ..core.extractor import DataExtractor
+
+            extractor = DataExtractor(config)
+
             # Test connection
-            self._test_connection(config)
+            self._test_connection(extractor)
 
             # Perform extraction
-            result = self._perform_extraction(url, config, summary, retry_attempts)
+            result = self._perform_extraction(extractor, url, summary, retry_attempts)
 
             # Output results
             self.output_formatter.format_output(result, output_format, output_file)
@@ -77,13 +143,7 @@ class ExtractCommand:
     def _setup_logging(self, verbose: bool) -> None:
         """Setup logging configuration."""
         level = logging.DEBUG if verbose else logging.INFO
-        log_file = self.config_manager.get_log_file_path()
-
-        logging.basicConfig(
-            level=level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
-        )
+        _configure_logging(level, self.config_manager.get_log_file_path())
 
     def _validate_inputs(
         self, url: str, output_format: str, output_file: Optional[str], max_content: Optional[int]
@@ -136,11 +196,11 @@ class ExtractCommand:
             self.console.print(f"💬 Custom prompt: {'Yes' if config.llm.custom_prompt else 'No'}")
             self.console.print(f"🌐 Base URL: {config.llm.base_url}")
 
-    def _test_connection(self, config: "WebExtractConfig") -> None:
+    def _test_connection(self, extractor: "DataExtractor") -> None:
         """Test connection to LLM service."""
-        self.console.print(PROGRESS_MESSAGES["connection_test"])
+        config = extractor.config
 
-        extractor = DataExtractor(config)
+        self.console.print(PROGRESS_MESSAGES["connection_test"])
 
         if not extractor.test_connection():
             suggestions = [
@@ -155,10 +215,9 @@ class ExtractCommand:
             raise CLIConnectionError("LLM service connection failed")
 
     def _perform_extraction(
-        self, url: str, config: "WebExtractConfig", summary: bool, retry_attempts: int
+        self, extractor: "DataExtractor", url: str, summary: bool, retry_attempts: int
     ) -> "StructuredData":
         """Perform the extraction with retry logic."""
-        extractor = DataExtractor(config)
         retry_handler = RetryHandler(self.console, max_retries=retry_attempts - 1)
 
         with ProgressTracker(self.console) as progress:
@@ -199,10 +258,10 @@ class ExtractCommand:
 class TestCommand:
     """Handle the test command."""
 
-    def __init__(self, console: Console):
+    def __init__(self, console: "Console"):
         self.console = console
         self.config_manager = ConfigManager()
-        self.error_handler = ErrorHandler(console, verbose=True)
+        self.error_handler = _error_handler(console, verbose=True)
 
     def execute(self, model: Optional[str] = None) -> int:
         """Execute the test command.
@@ -233,13 +292,7 @@ class TestCommand:
 
     def _setup_logging(self) -> None:
         """Setup verbose logging for test command."""
-        log_file = self.config_manager.get_log_file_path()
-
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
-        )
+        _configure_logging(logging.DEBUG, self.config_manager.get_log_file_path())
 
     def _prepare_config(self, model: Optional[str]) -> "WebExtractConfig":
         """Prepare configuration for testing."""
@@ -268,6 +321,8 @@ class TestCommand:
 
     def _run_connection_test(self, config: "WebExtractConfig") -> None:
         """Run connection test."""
+        from ..core.extractor import DataExtractor
+
         extractor = DataExtractor(config)
 
         if not extractor.test_connection():
@@ -277,7 +332,7 @@ class TestCommand:
 class VersionCommand:
     """Handle the version command."""
 
-    def __init__(self, console: Console):
+    def __init__(self, console: "Console"):
         self.console = console
 
     def execute(self) -> int:
@@ -287,14 +342,15 @@ class VersionCommand:
             Exit code
         """
         try:
+            # The package root is already imported with the CLI and resolves
+            # its version once; only the platform name is needed beyond that
             from .. import __author__, __version__
 
             self.console.print(f"LLM WebExtract v{__version__}")
             self.console.print(f"Author: {__author__}")
 
             # Show additional version info
-            env_info = EnvironmentManager.detect_environment()
-            self.console.print(f"Platform: {env_info['platform']}")
+            self.console.print(f"Platform: {os.name}")
 
             return 0
 
@@ -306,10 +362,10 @@ class VersionCommand:
 class ConfigCommand:
     """Handle configuration management commands."""
 
-    def __init__(self, console: Console):
+    def __init__(self, console: "Console"):
         self.console = console
         self.config_manager = ConfigManager()
-        self.error_handler = ErrorHandler(console)
+        self.error_handler = _error_handler(console)
 
     def show_config(self) -> int:
         """Show current configuration."""
@@ -336,6 +392,17 @@ class ConfigCommand:
             table.add_row("Request Timeout", f"{config.scraping.request_timeout}s")
             table.add_row("Retry Attempts", str(config.scraping.retry_attempts))
 
+            # LLM result cache
+            from ..core.cache import get_llm_cache
+
+            llm_cache = get_llm_cache(config.llm.cache_backend)
+            table.add_row("LLM Cache", config.llm.cache_backend or "disabled")
+            if llm_cache is not None and llm_cache.directory is not None:
+                usage = llm_cache.disk_usage()
+                table.add_row(
+                    "Cache Entries", f"{usage['entries']} ({usage['bytes'] / 1024:.1f} KB on disk)"
+                )
+
             self.console.print(table)
 
             return 0
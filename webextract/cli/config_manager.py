@@ -2,13 +2,42 @@
 
 import json
 import os
+import shutil
+import tempfile
+from dataclasses import fields, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from ..config.settings import ConfigBuilder, WebExtractConfig
+from ..config.settings import LLMConfig, ScrapingConfig, WebExtractConfig
 from .constants import DEFAULT_CONFIG_FILE, DEFAULT_LOG_FILE, DEFAULT_MODELS
 from .exceptions import CLIConfigurationError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Config file keys accepted for each section
+_LLM_FIELDS = frozenset(f.name for f in fields(LLMConfig))
+_SCRAPING_FIELDS = frozenset(f.name for f in fields(ScrapingConfig))
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize a config dictionary to indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse a config file's bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ConfigManager:
     """Manage CLI configuration and settings."""
@@ -16,6 +45,7 @@ class ConfigManager:
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file or DEFAULT_CONFIG_FILE
         self.config_path = Path(self.config_file)
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
 
     def load_config(self) -> WebExtractConfig:
         """Load configuration from file or create default.
@@ -44,14 +74,7 @@ class ConfigManager:
             CLIConfigurationError: If saving fails
         """
         try:
-            config_dict = self._config_to_dict(config)
-
-            # Ensure directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
-
+            self._write_config_dict(self._config_to_dict(config))
         except Exception as e:
             raise CLIConfigurationError(f"Failed to save configuration: {e}")
 
@@ -79,39 +102,48 @@ class ConfigManager:
         Returns:
             Updated configuration
         """
-        import copy
-
-        # Create a copy to avoid modifying the original
-        builder = ConfigBuilder()
-        builder._config = copy.deepcopy(config)
-
-        # Apply CLI overrides
-        if model is not None:
-            builder._config.llm.model_name = model
-
-        if max_content is not None:
-            builder._config.scraping.max_content_length = max_content
-
-        if custom_prompt is not None:
-            builder._config.llm.custom_prompt = custom_prompt
+        llm_overrides = {
+            "model_name": model,
+            "custom_prompt": custom_prompt,
+            "base_url": base_url,
+            "temperature": temperature,
+            "timeout": timeout,
+        }
+        scraping_overrides = {"max_content_length": max_content}
 
-        if base_url is not None:
-            builder._config.llm.base_url = base_url
+        # Build new config objects instead of modifying the original
+        return replace(
+            config,
+            llm=replace(config.llm, **{k: v for k, v in llm_overrides.items() if v is not None}),
+            scraping=replace(
+                config.scraping, **{k: v for k, v in scraping_overrides.items() if v is not None}
+            ),
+        )
 
-        if temperature is not None:
-            builder._config.llm.temperature = temperature
+    def _load_from_file(self) -> WebExtractConfig:
+        """Load configuration from JSON file."""
+        return self._dict_to_config(self._read_raw())
 
-        if timeout is not None:
-            builder._config.llm.timeout = timeout
+    def _read_raw(self) -> Dict[str, Any]:
+        """Read the raw config dictionary, reusing it while the file is unchanged.
 
-        return builder.build()
+        Returns:
+            Parsed config dictionary (empty if the file does not exist). Callers
+            must not mutate it.
+        """
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            self._cache = None
+            return {}
 
-    def _load_from_file(self) -> WebExtractConfig:
-        """Load configuration from JSON file."""
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            config_dict = json.load(f)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == signature:
+            return self._cache[1]
 
-        return self._dict_to_config(config_dict)
+        config_dict = _loads(self.config_path.read_bytes())
+        self._cache = (signature, config_dict)
+        return config_dict
 
     def _create_default_config(self) -> WebExtractConfig:
         """Create default configuration."""
@@ -119,6 +151,42 @@ class ConfigManager:
 
         return get_default_config()
 
+    def _write_config_dict(self, config_dict: Dict[str, Any]) -> bool:
+        """Write the config dictionary atomically, skipping identical content.
+
+        Returns:
+            True if the file was written
+        """
+        new_bytes = _dumps(config_dict)
+
+        try:
+            if self.config_path.read_bytes() == new_bytes:
+                return False
+        except OSError:
+            pass
+
+        # Ensure directory exists
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # A unique temp file per writer, created 0600; an existing config keeps
+        # its own mode so a user's chmod survives the save
+        tmp = tempfile.NamedTemporaryFile(
+            "wb", dir=self.config_path.parent, suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(new_bytes)
+            if self.config_path.exists():
+                shutil.copymode(self.config_path, tmp.name)
+            os.replace(tmp.name, self.config_path)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            raise
+        return True
+
     def _config_to_dict(self, config: WebExtractConfig) -> Dict[str, Any]:
         """Convert config to dictionary for JSON serialization."""
         return {
@@ -132,6 +200,7 @@ class ConfigManager:
                 "timeout": config.llm.timeout,
                 "retry_attempts": config.llm.retry_attempts,
                 "custom_prompt": config.llm.custom_prompt,
+                "cache_backend": config.llm.cache_backend,
             },
             "scraping": {
                 "user_agents": config.scraping.user_agents,
@@ -145,52 +214,36 @@ class ConfigManager:
 
     def _dict_to_config(self, config_dict: Dict[str, Any]) -> WebExtractConfig:
         """Convert dictionary to config object."""
-        builder = ConfigBuilder()
-
-        # Load LLM config
-        if "llm" in config_dict:
-            llm_dict = config_dict["llm"]
-            for key, value in llm_dict.items():
-                if hasattr(builder.llm_config, key) and value is not None:
-                    setattr(builder.llm_config, key, value)
-
-        # Load scraping config
-        if "scraping" in config_dict:
-            scraping_dict = config_dict["scraping"]
-            for key, value in scraping_dict.items():
-                if hasattr(builder.scraping_config, key) and value is not None:
-                    setattr(builder.scraping_config, key, value)
-
-        return builder.build()
+        llm_dict = config_dict.get("llm") or {}
+        scraping_dict = config_dict.get("scraping") or {}
+
+        return WebExtractConfig(
+            llm=LLMConfig(
+                **{k: v for k, v in llm_dict.items() if k in _LLM_FIELDS and v is not None}
+            ),
+            scraping=ScrapingConfig(
+                **{
+                    k: v
+                    for k, v in scraping_dict.items()
+                    if k in _SCRAPING_FIELDS and v is not None
+                }
+            ),
+        )
 
     def get_log_file_path(self) -> str:
         """Get the log file path for the current configuration."""
         # Try to load from config file if it exists
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    config_dict = json.load(f)
-                    return config_dict.get("log_file", DEFAULT_LOG_FILE)
-            except Exception:
-                pass
-
-        return DEFAULT_LOG_FILE
+        try:
+            return self._read_raw().get("log_file", DEFAULT_LOG_FILE)
+        except Exception:
+            return DEFAULT_LOG_FILE
 
     def set_log_file_path(self, log_file: str) -> None:
         """Set the log file path in configuration."""
         try:
-            config_dict = {}
-            if self.config_path.exists():
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    config_dict = json.load(f)
-
+            config_dict = dict(self._read_raw())
             config_dict["log_file"] = log_file
-
-            # Ensure directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            self._write_config_dict(config_dict)
 
         except Exception as e:
             raise CLIConfigurationError(f"Failed to set log file path: {e}")
@@ -201,30 +254,16 @@ class EnvironmentManager:
 
     @staticmethod
     def detect_environment() -> Dict[str, Any]:
-        """Detect the current environment and return relevant information."""
-        env_info = {
-            "platform": os.name,
-            "home_dir": str(Path.home()),
-            "cwd": str(Path.cwd()),
-            "python_path": os.environ.get("PYTHONPATH", ""),
-            "has_ollama": EnvironmentManager._check_command_available("ollama"),
-            "has_docker": EnvironmentManager._check_command_available("docker"),
-        }
-
-        # Check for API keys
-        env_info["api_keys"] = {
-            "openai": bool(os.environ.get("OPENAI_API_KEY")),
-            "anthropic": bool(os.environ.get("ANTHROPIC_API_KEY")),
-        }
+        """Detect the current environment and return relevant information.
 
-        return env_info
+        The result is computed once per process and shared; do not modify it.
+        """
+        return _detect_environment()
 
     @staticmethod
     def _check_command_available(command: str) -> bool:
         """Check if a command is available in the system."""
-        import shutil
-
-        return shutil.which(command) is not None
+        return _command_available(command)
 
     @staticmethod
     def get_default_model_for_environment() -> str:
@@ -240,3 +279,32 @@ class EnvironmentManager:
         else:
             # Default to Ollama even if not detected
             return DEFAULT_MODELS["ollama"]
+
+
+@lru_cache(maxsize=None)
+def _command_available(command: str) -> bool:
+    """Look up a command on PATH once per process."""
+    import shutil
+
+    return shutil.which(command) is not None
+
+
+@lru_cache(maxsize=1)
+def _detect_environment() -> Dict[str, Any]:
+    """Collect environment information once per process."""
+    env_info = {
+        "platform": os.name,
+        "home_dir": str(Path.home()),
+        "cwd": str(Path.cwd()),
+        "python_path": os.environ.get("PYTHONPATH", ""),
+        "has_ollama": _command_available("ollama"),
+        "has_docker": _command_available("docker"),
+    }
+
+    # Check for API keys
+    env_info["api_keys"] = {
+        "openai": bool(os.environ.get("OPENAI_API_KEY")),
+        "anthropic": bool(os.environ.get("ANTHROPIC_API_KEY")),
+    }
+
+    return env_info
@@ -1,6 +1,7 @@
 """CLI constants and configuration values."""
 
-from typing import Dict, List, Tuple
+from string import Formatter
+from typing import Callable, Dict, List, Tuple, Union
 
 # Output formats
 OUTPUT_FORMATS = ["json", "pretty", "yaml", "csv"]
@@ -85,3 +86,26 @@ ERROR_TEMPLATES = {
     "file_error": "❌ Error with file operation: {error}",
     "unexpected_error": "❌ Unexpected error: {error}",
 }
+
+# Templates pre-bound to their .format so the format string is looked up once
+ERROR_TEMPLATE_FORMATTERS: Dict[str, Callable[..., str]] = {
+    key: template.format for key, template in ERROR_TEMPLATES.items()
+}
+
+
+def _compile_suggestion(suggestion: str) -> Tuple[bool, Union[str, Callable[..., str]]]:
+    """Pair a suggestion with whether it takes the error message as a field.
+
+    Suggestions with placeholders other than ``{error}`` are kept as-is, matching
+    the previous behaviour of falling back to the raw text when formatting fails.
+    """
+    fields = {field for _, field, _, _ in Formatter().parse(suggestion) if field is not None}
+    if fields and fields <= {"error"}:
+        return True, suggestion.format
+    return False, suggestion
+
+
+ERROR_SUGGESTION_FORMATTERS: Dict[str, List[Tuple[bool, Union[str, Callable[..., str]]]]] = {
+    error_type: [_compile_suggestion(suggestion) for suggestion in suggestions]
+    for error_type, suggestions in ERROR_RECOVERY_SUGGESTIONS.items()
+}
@@ -1,12 +1,8 @@
 """Error handling and recovery for CLI operations."""
 
-import traceback
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from rich.console import Console
-from rich.panel import Panel
-
-from .constants import ERROR_RECOVERY_SUGGESTIONS, ERROR_TEMPLATES
+from .constants import ERROR_SUGGESTION_FORMATTERS, ERROR_TEMPLATE_FORMATTERS
 from .exceptions import (
     CLIConnectionError,
     CLIError,
@@ -15,11 +11,24 @@ from .exceptions import (
     CLIValidationError,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# (exception type, message keyword, type when keyword found, type otherwise)
+_ERROR_CLASSIFIERS = (
+    (CLIValidationError, "url", "invalid_url", "validation_error"),
+    (CLIConnectionError, "model", "model_not_found", "connection_failed"),
+    (CLIExtractionError, None, None, "extraction_failed"),
+    (CLIOutputError, None, None, "output_error"),
+)
+
+_BULLET = "  • "
+
 
 class ErrorHandler:
     """Centralized error handling and recovery suggestions."""
 
-    def __init__(self, console: Console, verbose: bool = False):
+    def __init__(self, console: "Console", verbose: bool = False):
         self.console = console
         self.verbose = verbose
 
@@ -42,6 +51,10 @@ class ErrorHandler:
 
     def _handle_cli_error(self, error: CLIError, context: Optional[str] = None) -> int:
         """Handle CLI-specific errors."""
+        # Nothing below is visible on a quiet console, so skip building it
+        if self.console.quiet:
+            return error.exit_code
+
         self.console.print(f"\n{error.message}", style="bold red")
 
         # Determine error type and provide specific suggestions
@@ -63,7 +76,10 @@ class ErrorHandler:
 
     def _handle_unexpected_error(self, error: Exception, context: Optional[str] = None) -> int:
         """Handle unexpected errors."""
-        error_msg = ERROR_TEMPLATES["unexpected_error"].format(error=str(error))
+        if self.console.quiet:
+            return 1
+
+        error_msg = ERROR_TEMPLATE_FORMATTERS["unexpected_error"](error=str(error))
         self.console.print(f"\n{error_msg}", style="bold red")
 
         # Always show traceback for unexpected errors when verbose
@@ -85,51 +101,34 @@ class ErrorHandler:
 
     def _classify_error(self, error: CLIError) -> str:
         """Classify the error type for targeted suggestions."""
-        error_msg = str(error).lower()
-
-        if isinstance(error, CLIValidationError):
-            if "url" in error_msg:
-                return "invalid_url"
-            return "validation_error"
-        elif isinstance(error, CLIConnectionError):
-            if "model" in error_msg:
-                return "model_not_found"
-            return "connection_failed"
-        elif isinstance(error, CLIExtractionError):
-            return "extraction_failed"
-        elif isinstance(error, CLIOutputError):
-            return "output_error"
-        else:
-            return "general_error"
+        for error_cls, needle, matched, default in _ERROR_CLASSIFIERS:
+            if isinstance(error, error_cls):
+                # Only lowercase the message when a keyword decides the type
+                if needle is not None and needle in error.message.lower():
+                    return matched
+                return default
+        return "general_error"
 
     def _get_recovery_suggestions(self, error_type: str, error: CLIError) -> List[str]:
         """Get recovery suggestions for the error type."""
-        suggestions = ERROR_RECOVERY_SUGGESTIONS.get(error_type, [])
-
-        # Format suggestions with error-specific information
-        formatted_suggestions = []
-        for suggestion in suggestions:
-            try:
-                # Try to format with error information
-                if hasattr(error, "message") and "{" in suggestion:
-                    suggestion = suggestion.format(error=error.message)
-                formatted_suggestions.append(suggestion)
-            except (KeyError, ValueError):
-                # If formatting fails, use the suggestion as-is
-                formatted_suggestions.append(suggestion)
-
-        return formatted_suggestions
+        # Templates are pre-compiled; only those using {error} need the message
+        return [
+            fmt(error=error.message) if needs_fmt else fmt
+            for needs_fmt, fmt in ERROR_SUGGESTION_FORMATTERS.get(error_type, [])
+        ]
 
     def _show_recovery_suggestions(self, suggestions: List[str], context: Optional[str] = None):
         """Display recovery suggestions to the user."""
         if not suggestions:
             return
 
+        from rich.panel import Panel
+
         title = "💡 Suggested Solutions"
         if context:
             title += f" ({context})"
 
-        suggestion_text = "\n".join(f"  • {suggestion}" for suggestion in suggestions)
+        suggestion_text = "\n".join(_BULLET + suggestion for suggestion in suggestions)
 
         panel = Panel(suggestion_text, title=title, border_style="yellow", padding=(1, 2))
 
@@ -137,6 +136,10 @@ class ErrorHandler:
 
     def _show_traceback(self, error: Exception):
         """Display detailed traceback information."""
+        import traceback
+
+        from rich.panel import Panel
+
         traceback_text = "".join(
             traceback.format_exception(type(error), error, error.__traceback__)
         )
@@ -165,7 +168,7 @@ class ErrorHandler:
 class RetryHandler:
     """Handle retry logic for failed operations."""
 
-    def __init__(self, console: Console, max_retries: int = 3):
+    def __init__(self, console: "Console", max_retries: int = 3):
         self.console = console
         self.max_retries = max_retries
 
@@ -186,22 +189,28 @@ class RetryHandler:
         import time
 
         last_error = None
+        # Messages are only formatted when they will actually be shown
+        report = not self.console.quiet
 
         for attempt in range(self.max_retries + 1):
             try:
                 if attempt > 0:
                     delay = 2 ** (attempt - 1)  # Exponential backoff
-                    self.console.print(
-                        f"⏳ Retrying in {delay} seconds... (attempt {attempt}/{self.max_retries})"
-                    )
+                    if report:
+                        self.console.print(
+                            f"⏳ Retrying in {delay} seconds... "
+                            f"(attempt {attempt}/{self.max_retries})"
+                        )
                     time.sleep(delay)
 
                 return operation(*args, **kwargs)
 
             except Exception as e:
                 last_error = e
+                if not report:
+                    continue
                 if attempt < self.max_retries:
-                    self.console.print(f"⚠️ Attempt {attempt + 1} failed: {str(e)}", style="yellow")
+                    self.console.print(f"⚠️ Attempt {attempt + 1} failed: {e}", style="yellow")
                 else:
                     self.console.print(
                         f"❌ All {self.max_retries + 1} attempts failed", style="red"
@@ -4,37 +4,43 @@
 class CLIError(Exception):
     """Base exception for CLI errors."""
 
+    __slots__ = ("message", "exit_code")
+
     def __init__(self, message: str, exit_code: int = 1):
         super().__init__(message)
         self.message = message
         self.exit_code = exit_code
 
+    def __reduce__(self):
+        """Pickle with the exit code, which slots keep out of the instance dict."""
+        return type(self), (self.message, self.exit_code)
+
 
 class CLIValidationError(CLIError):
     """Raised when CLI input validation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class CLIConfigurationError(CLIError):
     """Raised when CLI configuration is invalid."""
 
-    pass
+    __slots__ = ()
 
 
 class CLIConnectionError(CLIError):
     """Raised when connection tests fail."""
 
-    pass
+    __slots__ = ()
 
 
 class CLIExtractionError(CLIError):
     """Raised when extraction fails."""
 
-    pass
+    __slots__ = ()
 
 
 class CLIOutputError(CLIError):
     """Raised when output operations fail."""
 
-    pass
+    __slots__ = ()
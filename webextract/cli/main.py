@@ -1,13 +1,14 @@
 """Main CLI application with modular structure."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
 
-from .commands import ConfigCommand, ExtractCommand, TestCommand, VersionCommand
 from .constants import DEFAULT_OUTPUT_FORMAT
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 # Create the main app
 app = typer.Typer(
     name="llm-webextract",
@@ -16,8 +17,25 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 
-# Create console instance
-console = Console()
+# Shared console, created on first use (terminal detection is not free)
+_console = None
+
+
+def get_console() -> "Console":
+    """Return the shared console instance, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str):
+    """Provide the lazily created ``console`` as a module attribute."""
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @app.command()
@@ -60,7 +78,9 @@ def extract(
         Use specific model with custom prompt:
         $ llm-webextract extract https://example.com --model gpt-4 --prompt "Extract key facts"
     """
-    command = ExtractCommand(console)
+    from .commands import ExtractCommand
+
+    command = ExtractCommand(get_console())
     exit_code = command.execute(
         url=url,
         output_format=output_format,
@@ -94,7 +114,9 @@ def test(
         Test specific model:
         $ llm-webextract test --model llama3.2
     """
-    command = TestCommand(console)
+    from .commands import TestCommand
+
+    command = TestCommand(get_console())
     exit_code = command.execute(model=model)
     raise typer.Exit(exit_code)
 
@@ -106,7 +128,9 @@ def version():
     Displays the current version of LLM WebExtract along with
     author information and platform details.
     """
-    command = VersionCommand(console)
+    from .commands import VersionCommand
+
+    command = VersionCommand(get_console())
     exit_code = command.execute()
     raise typer.Exit(exit_code)
 
@@ -126,7 +150,9 @@ def config_show():
     Displays all current configuration values including LLM provider
     settings, model parameters, and scraping options.
     """
-    command = ConfigCommand(console)
+    from .commands import ConfigCommand
+
+    command = ConfigCommand(get_console())
     exit_code = command.show_config()
     raise typer.Exit(exit_code)
 
@@ -138,7 +164,9 @@ def config_init():
     Sets up initial configuration by detecting the environment
     and suggesting appropriate defaults.
     """
-    command = ConfigCommand(console)
+    from .commands import ConfigCommand
+
+    command = ConfigCommand(get_console())
     exit_code = command.init_config()
     raise typer.Exit(exit_code)
 
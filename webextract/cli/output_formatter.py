@@ -2,29 +2,92 @@
 
 import csv
 import json
+import threading
 from io import StringIO
-from typing import Any, Dict, List, Optional
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 try:
     import yaml
 
+    # libyaml's C emitter when PyYAML was built with it
+    _YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
     YAML_AVAILABLE = True
 except ImportError:
     YAML_AVAILABLE = False
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .constants import CONFIDENCE_COLORS, CONFIDENCE_THRESHOLDS, DISPLAY_LIMITS
 from .exceptions import CLIOutputError
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+
+# Confidence thresholds and colors bound once, colors ordered low to high
+_HIGH_THRESHOLD = CONFIDENCE_THRESHOLDS["high"]
+_MEDIUM_THRESHOLD = CONFIDENCE_THRESHOLDS["medium"]
+_CONFIDENCE_COLORS = (
+    CONFIDENCE_COLORS["low"],
+    CONFIDENCE_COLORS["medium"],
+    CONFIDENCE_COLORS["high"],
+)
+
+# Opening tag, closing tag and bold style for each confidence color
+_CONFIDENCE_MARKUP = {
+    color: (f"[{color}]", f"[/{color}]", f"bold {color}") for color in CONFIDENCE_COLORS.values()
+}
+
+# Per-thread CSV buffer and writer, reset and reused for every conversion
+_csv_local = threading.local()
+
+# Encoder for list/dict CSV cells; same output as json.dumps with default options
+_encode_csv_cell = json.JSONEncoder().encode
+
+# Shared encoder for display values; iterencode lets serialization stop early
+_DISPLAY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _dumps_bounded(value: Any, limit: int) -> str:
+    """Serialize value to indented JSON, truncated to limit characters.
+
+    Chunks are pulled from the encoder only until the limit is passed, so the
+    cost is bounded by the display limit rather than the size of value.
+
+    Args:
+        value: JSON-serializable value
+        limit: Maximum number of characters to keep
+
+    Returns:
+        JSON text, cut to limit and suffixed with "..." if it was longer
+    """
+    chunks = []
+    total = 0
+    for chunk in _DISPLAY_ENCODER.iterencode(value):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total > limit:
+            return "".join(chunks)[:limit] + "..."
+    return "".join(chunks)
+
 
 class OutputFormatter:
     """Handle different output formats for extraction results."""
 
-    def __init__(self, console: Console):
+    def __init__(self, console: "Console"):
         self.console = console
+        # Structured formats keyed by their lowercase name
+        self._structured_dispatch = {
+            "json": self._dump_json,
+            "yaml": self._dump_yaml,
+            "csv": self._convert_to_csv,
+        }
 
     def format_output(
         self, result: Any, format_type: str, output_file: Optional[str] = None
@@ -40,8 +103,12 @@ class OutputFormatter:
             CLIOutputError: If formatting or saving fails
         """
         try:
-            if format_type.lower() == "pretty":
-                self._display_pretty_output(result)
+            format_type = format_type.lower()
+            confidence = getattr(result, "confidence", 0.0)
+            confidence_color = self._get_confidence_color(confidence)
+
+            if format_type == "pretty":
+                self._display_pretty_output(result, confidence, confidence_color)
             else:
                 output_data = self._format_structured_output(result, format_type)
 
@@ -52,42 +119,78 @@ class OutputFormatter:
                     self._display_structured_output(output_data, format_type)
 
             # Always show confidence score
-            self._display_confidence_score(result)
+            self._display_confidence_score(result, confidence, confidence_color)
 
         except Exception as e:
             raise CLIOutputError(f"Output formatting failed: {e}")
 
+    @staticmethod
+    def _to_dict(obj: Any) -> Dict[str, Any]:
+        """Convert a result object to a dictionary in a single pass.
+
+        Args:
+            obj: Pydantic model, mapping or other dict-convertible object
+
+        Returns:
+            Dictionary view of obj (obj itself if it already is a dict)
+        """
+        if isinstance(obj, dict):
+            return obj
+        if hasattr(obj, "model_dump"):
+            return obj.model_dump()
+        if hasattr(obj, "dict"):
+            return obj.dict()
+        return dict(obj)
+
     def _format_structured_output(self, result: Any, format_type: str) -> str:
         """Format result as structured data.
 
         Args:
             result: Extraction result
-            format_type: Output format
+            format_type: Output format (lowercase)
 
         Returns:
             Formatted string
         """
-        # Convert to dictionary
-        if hasattr(result, "model_dump"):
-            data = result.model_dump()
-        elif hasattr(result, "dict"):
-            data = result.dict()
-        else:
-            data = dict(result)
-
-        if format_type.lower() == "json":
-            return json.dumps(data, indent=2, ensure_ascii=False)
-        elif format_type.lower() == "yaml":
-            if not YAML_AVAILABLE:
-                raise CLIOutputError(
-                    "YAML format requires 'pyyaml' package. Install with: pip install pyyaml"
-                )
-            return yaml.dump(data, default_flow_style=False, allow_unicode=True)
-        elif format_type.lower() == "csv":
-            return self._convert_to_csv(data)
-        else:
+        # Pydantic models serialize straight to JSON without building a dict first
+        if format_type == "json" and hasattr(result, "model_dump_json"):
+            return result.model_dump_json(indent=2)
+
+        handler = self._structured_dispatch.get(format_type)
+        if handler is None:
             raise CLIOutputError(f"Unsupported format: {format_type}")
 
+        return handler(self._to_dict(result))
+
+    def _dump_json(self, data: Dict[str, Any]) -> str:
+        """Convert data to indented JSON.
+
+        Args:
+            data: Data dictionary
+
+        Returns:
+            JSON formatted string
+        """
+        if ORJSON_AVAILABLE:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(data, option=options).decode("utf-8")
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def _dump_yaml(self, data: Dict[str, Any]) -> str:
+        """Convert data to YAML.
+
+        Args:
+            data: Data dictionary
+
+        Returns:
+            YAML formatted string
+        """
+        if not YAML_AVAILABLE:
+            raise CLIOutputError(
+                "YAML format requires 'pyyaml' package. Install with: pip install pyyaml"
+            )
+        return yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
+
     def _convert_to_csv(self, data: Dict[str, Any]) -> str:
         """Convert data to CSV format.
 
@@ -97,8 +200,14 @@ class OutputFormatter:
         Returns:
             CSV formatted string
         """
-        output = StringIO()
-        writer = csv.writer(output)
+        output = getattr(_csv_local, "buffer", None)
+        if output is None:
+            output = _csv_local.buffer = StringIO()
+            _csv_local.writer = csv.writer(output)
+        else:
+            output.seek(0)
+            output.truncate(0)
+        writer = _csv_local.writer
 
         # Write header
         writer.writerow(["Field", "Value"])
@@ -110,7 +219,7 @@ class OutputFormatter:
         for key, value in flattened.items():
             # Convert lists/dicts to JSON strings for CSV
             if isinstance(value, (list, dict)):
-                value = json.dumps(value)
+                value = _encode_csv_cell(value)
             writer.writerow([key, str(value)])
 
         return output.getvalue()
@@ -118,6 +227,10 @@ class OutputFormatter:
     def _flatten_dict(self, data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
         """Flatten nested dictionary.
 
+        Walks the data with an explicit stack of item iterators rather than
+        recursing, so keys are joined only once per leaf and rows keep their
+        depth-first order.
+
         Args:
             data: Dictionary to flatten
             prefix: Key prefix
@@ -125,22 +238,34 @@ class OutputFormatter:
         Returns:
             Flattened dictionary
         """
-        flattened = {}
 
-        for key, value in data.items():
-            new_key = f"{prefix}.{key}" if prefix else key
+        def entries(parts, mapping):
+            return ((parts + (str(key),), value, True) for key, value in mapping.items())
 
-            if isinstance(value, dict):
-                flattened.update(self._flatten_dict(value, new_key))
+        flattened = {}
+        stack = [entries((prefix,) if prefix else (), data)]
+
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            parts, value, expand = entry
+            if not expand:
+                flattened[".".join(parts)] = value
+            elif isinstance(value, dict):
+                stack.append(entries(parts, value))
             elif isinstance(value, list) and value and isinstance(value[0], dict):
-                # Handle list of dictionaries
-                for i, item in enumerate(value):
-                    if isinstance(item, dict):
-                        flattened.update(self._flatten_dict(item, f"{new_key}[{i}]"))
-                    else:
-                        flattened[f"{new_key}[{i}]"] = item
+                # Handle list of dictionaries; non-dict items are kept as they are
+                head, last = parts[:-1], parts[-1]
+                indexed = [
+                    (head + (f"{last}[{i}]",), item, isinstance(item, dict))
+                    for i, item in enumerate(value)
+                ]
+                stack.append(iter(indexed))
             else:
-                flattened[new_key] = value
+                flattened[".".join(parts)] = value
 
         return flattened
 
@@ -166,7 +291,7 @@ class OutputFormatter:
             data: Formatted data string
             format_type: Format type
         """
-        if format_type.lower() == "json":
+        if format_type == "json":
             # Use rich's JSON formatting for better display
             try:
                 parsed_json = json.loads(data)
@@ -176,108 +301,131 @@ class OutputFormatter:
         else:
             self.console.print(data)
 
-    def _display_pretty_output(self, result: Any) -> None:
+    def _display_pretty_output(
+        self,
+        result: Any,
+        confidence: Optional[float] = None,
+        confidence_color: Optional[str] = None,
+    ) -> None:
         """Display results in pretty format.
 
         Args:
             result: Extraction result object
+            confidence: Confidence already read from result, if available
+            confidence_color: Color already computed for confidence, if available
         """
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.table import Table
+
+        # Read every attribute once; the sections below work from these locals
+        url = getattr(result, "url", "N/A")
+        extracted_at = getattr(result, "extracted_at", "N/A")
+        content = getattr(result, "content", None)
+        structured_info = getattr(result, "structured_info", None)
+        if confidence is None:
+            confidence = getattr(result, "confidence", 0.0)
+        if confidence_color is None:
+            confidence_color = self._get_confidence_color(confidence)
+
+        if content:
+            title = getattr(content, "title", None) or "N/A"
+            description = getattr(content, "description", None)
+            links = getattr(content, "links", None)
+        else:
+            title, description, links = "N/A", None, None
+
         # Main info panel
         info_table = Table(show_header=False, box=None)
-        info_table.add_row("URL:", getattr(result, "url", "N/A"))
-        info_table.add_row("Extracted:", getattr(result, "extracted_at", "N/A"))
-
-        confidence = getattr(result, "confidence", 0.0)
-        confidence_color = self._get_confidence_color(confidence)
-        info_table.add_row(
-            "Confidence:", f"[{confidence_color}]{confidence:.2f}[/{confidence_color}]"
-        )
-
-        # Get title from content if available
-        title = "N/A"
-        if hasattr(result, "content") and result.content:
-            title = getattr(result.content, "title", "N/A") or "N/A"
-
+        info_table.add_row("URL:", url)
+        info_table.add_row("Extracted:", extracted_at)
+        open_tag, close_tag, _ = _CONFIDENCE_MARKUP[confidence_color]
+        info_table.add_row("Confidence:", f"{open_tag}{confidence:.2f}{close_tag}")
         info_table.add_row("Title:", title)
 
-        self.console.print(Panel(info_table, title="📄 Extraction Info", border_style="blue"))
+        # Panels are collected and printed as one group, so Rich renders once
+        panels = [Panel(info_table, title="📄 Extraction Info", border_style="blue")]
 
         # Content summary
-        if hasattr(result, "content") and result.content:
-            description = getattr(result.content, "description", None)
-            if description:
-                # Truncate long descriptions
-                if len(description) > DISPLAY_LIMITS["description_truncate"]:
-                    description = description[: DISPLAY_LIMITS["description_truncate"]] + "..."
-
-                self.console.print(
-                    Panel(
-                        description,
-                        title="📝 Description",
-                        border_style="green",
-                    )
+        if description:
+            # Truncate long descriptions
+            if len(description) > DISPLAY_LIMITS["description_truncate"]:
+                description = description[: DISPLAY_LIMITS["description_truncate"]] + "..."
+
+            panels.append(
+                Panel(
+                    description,
+                    title="📝 Description",
+                    border_style="green",
                 )
+            )
 
         # Structured data
-        if hasattr(result, "structured_info") and result.structured_info:
-            self._display_structured_info(result.structured_info)
+        if structured_info:
+            panels.append(self._structured_info_panel(structured_info))
 
         # Links
-        if hasattr(result, "content") and result.content:
-            links = getattr(result.content, "links", [])
-            if links:
-                self._display_links(links)
+        if links:
+            panels.append(self._links_panel(links, getattr(content, "link_count", None)))
+
+        self.console.print(Group(*panels))
 
-    def _display_structured_info(self, structured_info: Any) -> None:
-        """Display structured information in a table.
+    def _structured_info_panel(self, structured_info: Any) -> "Panel":
+        """Build the panel showing structured information in a table.
 
         Args:
             structured_info: Structured information object or dict
+
+        Returns:
+            Panel to render
         """
+        from rich.panel import Panel
+        from rich.table import Table
+
         structured_table = Table(show_header=True, header_style="bold magenta")
         structured_table.add_column("Field", style="cyan")
         structured_table.add_column("Value", style="white")
 
         # Convert to dictionary format
-        if hasattr(structured_info, "model_dump"):
-            structured_dict = structured_info.model_dump()
-        elif hasattr(structured_info, "dict"):
-            structured_dict = structured_info.dict()
-        elif isinstance(structured_info, dict):
-            structured_dict = structured_info
-        else:
-            try:
-                structured_dict = dict(structured_info)
-            except (TypeError, ValueError):
-                structured_dict = {"data": str(structured_info)}
+        try:
+            structured_dict = self._to_dict(structured_info)
+        except (TypeError, ValueError):
+            structured_dict = {"data": str(structured_info)}
 
-        # Display each field
+        # Display each field; bound methods avoid per-row attribute lookups
+        format_value = self._format_value_for_display
+        add_row = structured_table.add_row
         for key, value in structured_dict.items():
-            value_str = self._format_value_for_display(value)
-            structured_table.add_row(key, value_str)
-
-        self.console.print(
-            Panel(
-                structured_table,
-                title="🧠 LLM Analysis",
-                border_style="yellow",
-            )
+            add_row(key, format_value(value))
+
+        return Panel(
+            structured_table,
+            title="🧠 LLM Analysis",
+            border_style="yellow",
         )
 
-    def _display_links(self, links: List[str]) -> None:
-        """Display links section.
+    def _links_panel(self, links: Iterable[str], total: Optional[int] = None) -> "Panel":
+        """Build the links section panel.
 
         Args:
-            links: List of links
+            links: Links to display; only the first few are consumed
+            total: Total number of links, if known without counting
+
+        Returns:
+            Panel to render
         """
-        display_links = links[: DISPLAY_LIMITS["links"]]
-        links_text = "\n".join(display_links)
+        from rich.panel import Panel
+
+        limit = DISPLAY_LIMITS["links"]
+
+        if total is None:
+            total = len(links) if hasattr(links, "__len__") else limit
 
-        if len(links) > DISPLAY_LIMITS["links"]:
-            remaining = len(links) - DISPLAY_LIMITS["links"]
-            links_text += f"\n... and {remaining} more links"
+        # Build the text in one join, with the overflow note as a final line
+        more = (f"... and {total - limit} more links",) if total > limit else ()
+        links_text = "\n".join(chain(islice(links, limit), more))
 
-        self.console.print(Panel(links_text, title="🔗 Important Links", border_style="cyan"))
+        return Panel(links_text, title="🔗 Important Links", border_style="cyan")
 
     def _format_value_for_display(self, value: Any) -> str:
         """Format a value for pretty display.
@@ -288,16 +436,14 @@ class OutputFormatter:
         Returns:
             Formatted string
         """
+        limit = DISPLAY_LIMITS["value_truncate"]
+
         if isinstance(value, (list, dict)):
-            json_str = json.dumps(value, indent=2, ensure_ascii=False)
-            if len(json_str) > DISPLAY_LIMITS["value_truncate"]:
-                return json_str[: DISPLAY_LIMITS["value_truncate"]] + "..."
-            return json_str
-        else:
-            str_value = str(value)
-            if len(str_value) > DISPLAY_LIMITS["value_truncate"]:
-                return str_value[: DISPLAY_LIMITS["value_truncate"]] + "..."
-            return str_value
+            return _dumps_bounded(value, limit)
+
+        text = str(value)
+
+        return text[:limit] + "..." if len(text) > limit else text
 
     def _get_confidence_color(self, confidence: float) -> str:
         """Get color for confidence score.
@@ -308,32 +454,42 @@ class OutputFormatter:
         Returns:
             Color name
         """
-        if confidence >= CONFIDENCE_THRESHOLDS["high"]:
-            return CONFIDENCE_COLORS["high"]
-        elif confidence >= CONFIDENCE_THRESHOLDS["medium"]:
-            return CONFIDENCE_COLORS["medium"]
-        else:
-            return CONFIDENCE_COLORS["low"]
-
-    def _display_confidence_score(self, result: Any) -> None:
+        # Each threshold passed moves one step up the low/medium/high colors
+        return _CONFIDENCE_COLORS[
+            (confidence >= _MEDIUM_THRESHOLD) + (confidence >= _HIGH_THRESHOLD)
+        ]
+
+    def _display_confidence_score(
+        self,
+        result: Any,
+        confidence: Optional[float] = None,
+        confidence_color: Optional[str] = None,
+    ) -> None:
         """Display confidence score.
 
         Args:
             result: Extraction result
+            confidence: Confidence already read from result, if available
+            confidence_color: Color already computed for confidence, if available
         """
-        confidence = getattr(result, "confidence", 0.0)
-        confidence_color = self._get_confidence_color(confidence)
+        if confidence is None:
+            confidence = getattr(result, "confidence", 0.0)
+        if confidence_color is None:
+            confidence_color = self._get_confidence_color(confidence)
 
         message = f"✅ Extraction completed successfully! (Confidence: {confidence:.2f})"
-        self.console.print(message, style=f"bold {confidence_color}")
+        self.console.print(message, style=_CONFIDENCE_MARKUP[confidence_color][2])
 
 
 class ProgressTracker:
     """Track and display progress for long-running operations."""
 
-    def __init__(self, console: Console):
+    def __init__(self, console: "Console"):
         self.console = console
+        # Own display, built on first use and restarted for later operations
+        self._own_progress = None
         self._current_progress = None
+        self._current_task = None
 
     def start_progress(self, description: str):
         """Start a progress indicator.
@@ -341,14 +497,21 @@ class ProgressTracker:
         Args:
             description: Description of the operation
         """
-        from rich.progress import Progress, SpinnerColumn, TextColumn
+        if self._own_progress is None:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
 
-        self._current_progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-        )
+            self._own_progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console,
+            )
+
+        else:
+            # Drop the previous operation's task so the restarted display starts empty
+            for task_id in self._own_progress.task_ids:
+                self._own_progress.remove_task(task_id)
 
+        self._current_progress = self._own_progress
         self._current_progress.start()
         self._current_task = self._current_progress.add_task(description, total=None)
 
@@ -358,7 +521,7 @@ class ProgressTracker:
         Args:
             description: New description
         """
-        if self._current_progress and self._current_task:
+        if self._current_progress and self._current_task is not None:
             self._current_progress.update(self._current_task, description=description)
 
     def stop_progress(self):
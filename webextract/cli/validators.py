@@ -1,33 +1,71 @@
 """Input validation utilities for CLI."""
 
 import os
+import re
+from functools import lru_cache
 from typing import Optional, Tuple
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
-from .constants import ERROR_TEMPLATES, OUTPUT_FORMATS, REQUIRED_URL_PARTS, URL_SCHEMES
+from .constants import ERROR_TEMPLATES, OUTPUT_FORMATS, URL_SCHEMES
 from .exceptions import CLIValidationError
 
+# Lookup set and error message for the URL scheme check, built once
+_URL_SCHEMES = frozenset(URL_SCHEMES)
+_URL_SCHEME_ERROR = f"URL scheme must be one of: {', '.join(URL_SCHEMES)}"
+
+# Lookup set and error message for the output format check
+_OUTPUT_FORMATS = frozenset(OUTPUT_FORMATS)
+_OUTPUT_FORMAT_ERROR = ERROR_TEMPLATES["invalid_format"].format(formats=", ".join(OUTPUT_FORMATS))
+
+# Plain ASCII http(s) URLs with a host; anything else goes through urlsplit.
+# Brackets are left to the parser since it validates IPv6 hosts.
+_URL_FAST = re.compile(
+    r"https?://[A-Za-z0-9\-._~%!$&'()*+,;=:@]+(?:[/?#][!-~]*)?",
+    re.IGNORECASE,
+)
+
+# Characters not allowed in model names, found in a single scan
+_INVALID_MODEL_CHARS = re.compile(r"[\"'\n\r]")
+
+# URLs longer than this are validated without being cached
+_URL_CACHE_MAX_LENGTH = 2048
+
 
 def validate_url(url: str) -> Tuple[bool, Optional[str]]:
     """Validate URL format.
 
+    Ordinary http(s) URLs are accepted by a precompiled regex; others are
+    parsed, with results memoized so retries and batch runs hit the cache.
+
     Args:
         url: URL to validate
 
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if not isinstance(url, str):
+        return _validate_url(url)
+    if _URL_FAST.fullmatch(url):
+        return True, None
+    if len(url) <= _URL_CACHE_MAX_LENGTH:
+        return _validate_url_cached(url)
+    return _validate_url(url)
+
+
+def _validate_url(url: str) -> Tuple[bool, Optional[str]]:
+    """Validate URL format without caching."""
     try:
-        parsed = urlparse(url)
+        # urlsplit yields the same scheme and netloc as urlparse without
+        # splitting path parameters, which are not checked here
+        parsed = urlsplit(url)
 
-        # Check required parts
-        for part in REQUIRED_URL_PARTS:
-            if not getattr(parsed, part):
-                return False, ERROR_TEMPLATES["invalid_url"]
+        # Check required parts (constants.REQUIRED_URL_PARTS)
+        if not parsed.scheme or not parsed.netloc:
+            return False, ERROR_TEMPLATES["invalid_url"]
 
-        # Check scheme
-        if parsed.scheme.lower() not in URL_SCHEMES:
-            return False, f"URL scheme must be one of: {', '.join(URL_SCHEMES)}"
+        # Check scheme (urlsplit already lowercases it)
+        if parsed.scheme not in _URL_SCHEMES:
+            return False, _URL_SCHEME_ERROR
 
         return True, None
 
@@ -35,6 +73,9 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
         return False, f"URL parsing error: {str(e)}"
 
 
+_validate_url_cached = lru_cache(maxsize=1024)(_validate_url)
+
+
 def validate_output_format(format_name: str) -> Tuple[bool, Optional[str]]:
     """Validate output format.
 
@@ -44,12 +85,11 @@ def validate_output_format(format_name: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if format_name.lower() not in OUTPUT_FORMATS:
-        formats_str = ", ".join(OUTPUT_FORMATS)
-        error_msg = ERROR_TEMPLATES["invalid_format"].format(formats=formats_str)
-        return False, error_msg
+    # Canonical lowercase names (the CLI default) match without lowercasing
+    if format_name in _OUTPUT_FORMATS or format_name.lower() in _OUTPUT_FORMATS:
+        return True, None
 
-    return True, None
+    return False, _OUTPUT_FORMAT_ERROR
 
 
 def validate_output_file(file_path: str) -> Tuple[bool, Optional[str]]:
@@ -118,6 +158,8 @@ def validate_confidence_threshold(value: Optional[float]) -> Tuple[bool, Optiona
 class InputValidator:
     """Centralized input validation for CLI commands."""
 
+    __slots__ = ()
+
     @staticmethod
     def validate_extract_params(
         url: str,
@@ -174,5 +216,5 @@ class InputValidator:
             raise CLIValidationError("Model name cannot be empty")
 
         # Basic format validation
-        if any(char in model_name for char in ['"', "'", "\n", "\r"]):
+        if _INVALID_MODEL_CHARS.search(model_name):
             raise CLIValidationError("Model name contains invalid characters")
@@ -1,11 +1,26 @@
 """Configuration settings for WebExtract package."""
 
 import os
+import random
+import threading
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
+from .._compat import DATACLASS_OPTIONS
 
-@dataclass
+# Default browser user agents rotated between requests
+DEFAULT_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ScrapingConfig:
     """Configuration for web scraping behavior."""
 
@@ -14,19 +29,15 @@ class ScrapingConfig:
     retry_attempts: int = 3
     retry_delay: float = 2.0
     request_delay: float = 1.0
-    user_agents: List[str] = field(
-        default_factory=lambda: [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-        ]
-    )
-
-
-@dataclass
+    user_agents: Tuple[str, ...] = DEFAULT_USER_AGENTS
+
+    def __post_init__(self):
+        """Store user agents as a tuple so the config stays hashable."""
+        if not isinstance(self.user_agents, tuple):
+            object.__setattr__(self, "user_agents", tuple(self.user_agents))
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class LLMConfig:
     """Configuration for LLM processing."""
 
@@ -37,11 +48,12 @@ class LLMConfig:
     max_tokens: int = 4000  # Increased for better responses
     retry_attempts: int = 3
     api_key: Optional[str] = None
-    custom_prompt: Optional[str] = None
+    custom_prompt: Optional[str] = None  # Keep static: it is sent ahead of page content
     timeout: int = 60
+    cache_backend: Optional[str] = None  # "memory", "disk" or a directory; used at temperature 0
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class WebExtractConfig:
     """Main configuration class."""
 
@@ -66,109 +78,166 @@ class WebExtractConfig:
             max_tokens=int(os.getenv("WEBEXTRACT_MAX_TOKENS", "4000")),
             api_key=os.getenv("WEBEXTRACT_API_KEY"),
             timeout=int(os.getenv("WEBEXTRACT_LLM_TIMEOUT", "60")),
+            cache_backend=os.getenv("WEBEXTRACT_LLM_CACHE"),
         )
 
         return cls(scraping=scraping, llm=llm)
 
 
 class ConfigBuilder:
-    """Fluent API for building configurations."""
+    """Fluent API for building configurations.
+
+    Settings are collected as field values and the immutable config is
+    constructed once in build().
+    """
+
+    __slots__ = ("_scraping", "_llm")
 
     def __init__(self):
-        self._config = WebExtractConfig()
+        self._scraping: Dict[str, Any] = {}
+        self._llm: Dict[str, Any] = {}
 
     def with_model(self, model_name: str, provider: str = "ollama") -> "ConfigBuilder":
         """Set the LLM model."""
-        self._config.llm.model_name = model_name
-        self._config.llm.provider = provider
+        self._llm.update(model_name=model_name, provider=provider)
         return self
 
     def with_ollama(
         self, model: str = "llama3.2", base_url: str = "http://localhost:11434"
     ) -> "ConfigBuilder":
         """Configure for Ollama."""
-        self._config.llm.provider = "ollama"
-        self._config.llm.model_name = model
-        self._config.llm.base_url = base_url
+        self._llm.update(provider="ollama", model_name=model, base_url=base_url)
         return self
 
     def with_openai(self, api_key: str, model: str = "gpt-4o-mini") -> "ConfigBuilder":
         """Configure for OpenAI."""
-        self._config.llm.provider = "openai"
-        self._config.llm.api_key = api_key
-        self._config.llm.model_name = model
-        self._config.llm.base_url = "https://api.openai.com/v1"
+        self._llm.update(
+            provider="openai",
+            api_key=api_key,
+            model_name=model,
+            base_url="https://api.openai.com/v1",
+        )
         return self
 
     def with_anthropic(
         self, api_key: str, model: str = "claude-3-5-sonnet-20241022"
     ) -> "ConfigBuilder":
         """Configure for Anthropic."""
-        self._config.llm.provider = "anthropic"
-        self._config.llm.api_key = api_key
-        self._config.llm.model_name = model
+        self._llm.update(provider="anthropic", api_key=api_key, model_name=model)
         return self
 
     def with_timeout(self, timeout: int) -> "ConfigBuilder":
         """Set request timeout."""
-        self._config.scraping.request_timeout = timeout
-        self._config.llm.timeout = timeout
+        self._scraping["request_timeout"] = timeout
+        self._llm["timeout"] = timeout
         return self
 
     def with_content_limit(self, limit: int) -> "ConfigBuilder":
         """Set content length limit."""
-        self._config.scraping.max_content_length = limit
+        self._scraping["max_content_length"] = limit
         return self
 
     def with_custom_prompt(self, prompt: str) -> "ConfigBuilder":
         """Set custom extraction prompt."""
-        self._config.llm.custom_prompt = prompt
+        self._llm["custom_prompt"] = prompt
         return self
 
     def with_temperature(self, temperature: float) -> "ConfigBuilder":
         """Set LLM temperature."""
-        self._config.llm.temperature = max(0.0, min(1.0, temperature))
+        self._llm["temperature"] = max(0.0, min(1.0, temperature))
+        return self
+
+    def with_cache(self, backend: str = "disk") -> "ConfigBuilder":
+        """Cache deterministic (temperature 0) LLM results."""
+        self._llm["cache_backend"] = backend
         return self
 
     def build(self) -> WebExtractConfig:
         """Build the configuration."""
-        return self._config
+        return WebExtractConfig(
+            scraping=ScrapingConfig(**self._scraping), llm=LLMConfig(**self._llm)
+        )
+
 
+# Static request headers; only the User-Agent varies between requests
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
 
-# Default global configuration instance
+# Pre-drawn user agent picks, refilled in batches to amortize RNG calls.
+# Each thread keeps its own RNG and buffer, so scraping threads never contend.
+_UA_BATCH_SIZE = 256
+_ua_state = threading.local()
+
+# Configuration installed with set_default_config(); None means "from the environment"
 _default_config = None
 
+# Tuple of the default config's user agents, rebuilt when the default changes
+_default_user_agents = None
+
 
+@lru_cache(maxsize=None)
 def get_default_config() -> WebExtractConfig:
-    """Get the default configuration instance."""
-    global _default_config
-    if _default_config is None:
-        _default_config = WebExtractConfig.from_env()
-    return _default_config
+    """Get the default configuration instance.
+
+    Resolved on the first call and memoized; set_default_config() clears it.
+    """
+    if _default_config is not None:
+        return _default_config
+    return WebExtractConfig.from_env()
 
 
 def set_default_config(config: WebExtractConfig):
     """Set the default configuration instance."""
-    global _default_config
+    global _default_config, _default_user_agents
     _default_config = config
+    _default_user_agents = None
+    get_default_config.cache_clear()
+
+
+def _get_default_user_agents() -> tuple:
+    """Return the default config's user agents as a tuple, built once per config."""
+    global _default_user_agents
+    if _default_user_agents is None:
+        _default_user_agents = tuple(get_default_config().scraping.user_agents)
+    return _default_user_agents
+
+
+def _next_user_agent(pool: tuple) -> str:
+    """Return the next user agent from this thread's pre-drawn random buffer."""
+    state = _ua_state
+    if getattr(state, "pool", None) is not pool or state.idx >= len(state.ring):
+        if not hasattr(state, "rng"):
+            state.rng = random.Random()
+        state.pool = pool
+        state.ring = state.rng.choices(pool, k=_UA_BATCH_SIZE)
+        state.idx = 0
+    user_agent = state.ring[state.idx]
+    state.idx += 1
+    return user_agent
+
+
+@lru_cache(maxsize=32)
+def _headers_for(user_agent: str) -> tuple:
+    """Return the immutable header items for a user agent."""
+    return (("User-Agent", user_agent),) + tuple(_BASE_HEADERS.items())
 
 
 def get_http_headers(custom_user_agent: str = None) -> dict:
-    """Get HTTP headers with rotating user agents."""
-    import random
-
-    config = get_default_config()
-    user_agent = custom_user_agent or random.choice(config.scraping.user_agents)
-
-    return {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "DNT": "1",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-    }
+    """Get HTTP headers with rotating user agents.
+
+    The default config's user agents are snapshotted on first use and again
+    after set_default_config(); edit them through a new config, not in place.
+    """
+    user_agent = custom_user_agent or _next_user_agent(_get_default_user_agents())
+
+    # Callers get their own dict, so mutating it never touches the cache
+    return dict(_headers_for(user_agent))
 
 
 # Legacy compatibility layer - will be removed in future versions
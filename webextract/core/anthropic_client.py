@@ -1,7 +1,8 @@
 """Anthropic Claude client for processing extracted content."""
 
 import logging
-from typing import Any, Dict
+import re
+from typing import Any, Dict, List
 
 from .exceptions import (
     AuthenticationError,
@@ -12,8 +13,87 @@ from .exceptions import (
 )
 from .llm_client import BaseLLMClient
 
+# Imported once with the module; the client raises LLMError when it is missing
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
 logger = logging.getLogger(__name__)
 
+# Tool definition for schema-less extraction; built once and never mutated
+_DEFAULT_EXTRACTION_TOOL = {
+    "name": "extract_structured_data",
+    "description": "Extract structured information from content and return as JSON",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "summary": {
+                "type": "string",
+                "description": "Clear, concise summary (2-3 sentences)",
+            },
+            "topics": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Main topics discussed",
+            },
+            "category": {
+                "type": "string",
+                "description": "Primary category (technology/business/news/education/entertainment/other)",
+            },
+            "sentiment": {
+                "type": "string",
+                "description": "Overall tone (positive/negative/neutral)",
+            },
+            "entities": {
+                "type": "object",
+                "properties": {
+                    "people": {"type": "array", "items": {"type": "string"}},
+                    "organizations": {"type": "array", "items": {"type": "string"}},
+                    "locations": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["people", "organizations", "locations"],
+            },
+            "key_facts": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Important facts or claims",
+            },
+            "important_dates": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Dates mentioned with context",
+            },
+            "statistics": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Numbers, percentages, or metrics",
+            },
+        },
+        "required": [
+            "summary",
+            "topics",
+            "category",
+            "sentiment",
+            "entities",
+            "key_facts",
+            "important_dates",
+            "statistics",
+        ],
+    },
+}
+
+_EXTRACTION_TOOL_CHOICE = {"type": "tool", "name": _DEFAULT_EXTRACTION_TOOL["name"]}
+
+# Error message categories, tried in priority order from the start of the text;
+# the named group that matched is the category
+_ERROR_CATEGORY = re.compile(
+    r"(?=.*rate)(?=.*limit)(?P<rate>)"
+    r"|(?=.*(?:authentication|api_key))(?P<auth>)"
+    r"|(?=.*model)(?=.*(?:not found|invalid))(?P<model>)",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 class AnthropicClient(BaseLLMClient):
     """Client for interacting with Anthropic Claude models."""
@@ -27,16 +107,15 @@ class AnthropicClient(BaseLLMClient):
 
     def _setup_client(self):
         """Set up the Anthropic client."""
-        try:
-            import anthropic
-
-            self._client = anthropic.Anthropic(api_key=self.api_key)
-        except ImportError:
+        if anthropic is None:
             raise LLMError(
                 "Anthropic package not installed",
                 provider="anthropic",
                 suggestions=["Install with: pip install anthropic"],
             )
+
+        try:
+            self._client = anthropic.Anthropic(api_key=self.api_key)
         except Exception as e:
             raise AuthenticationError(
                 "Failed to setup Anthropic client", provider="anthropic", original_error=e
@@ -89,85 +168,23 @@ class AnthropicClient(BaseLLMClient):
     ) -> Dict[str, Any]:
         """Generate structured data using Claude's tool calling for better reliability."""
         try:
-            # Truncate content if needed
-            truncated_content = content[: self.max_content_length]
-            if len(content) > self.max_content_length:
-                logger.info(
-                    f"Content truncated from {len(content)} to {self.max_content_length} characters"
-                )
-
-            # Define extraction tool
-            extraction_tool = {
-                "name": "extract_structured_data",
-                "description": "Extract structured information from content and return as JSON",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "summary": {
-                            "type": "string",
-                            "description": "Clear, concise summary (2-3 sentences)",
-                        },
-                        "topics": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Main topics discussed",
-                        },
-                        "category": {
-                            "type": "string",
-                            "description": "Primary category (technology/business/news/education/entertainment/other)",
-                        },
-                        "sentiment": {
-                            "type": "string",
-                            "description": "Overall tone (positive/negative/neutral)",
-                        },
-                        "entities": {
-                            "type": "object",
-                            "properties": {
-                                "people": {"type": "array", "items": {"type": "string"}},
-                                "organizations": {"type": "array", "items": {"type": "string"}},
-                                "locations": {"type": "array", "items": {"type": "string"}},
-                            },
-                            "required": ["people", "organizations", "locations"],
-                        },
-                        "key_facts": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Important facts or claims",
-                        },
-                        "important_dates": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Dates mentioned with context",
-                        },
-                        "statistics": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Numbers, percentages, or metrics",
-                        },
-                    },
-                    "required": [
-                        "summary",
-                        "topics",
-                        "category",
-                        "sentiment",
-                        "entities",
-                        "key_facts",
-                        "important_dates",
-                        "statistics",
-                    ],
-                },
-            }
+            truncated_content = self._truncate_content(content)
 
-            # Override schema if provided
+            # Default tool, or a copy carrying the caller's schema
             if schema:
-                extraction_tool["input_schema"] = schema
-
-            user_message = f"""Analyze the following content and extract structured information using the extract_structured_data tool.
-
-CONTENT TO ANALYZE:
-{truncated_content}
+                extraction_tool = {**_DEFAULT_EXTRACTION_TOOL, "input_schema": schema}
+            else:
+                extraction_tool = _DEFAULT_EXTRACTION_TOOL
 
-{custom_prompt or "Extract all relevant information and structure it according to the tool schema."}"""
+            instructions = (
+                custom_prompt
+                or "Extract all relevant information and structure it according to the tool schema."
+            )
+            user_content = self._cacheable_user_content(
+                "Analyze the content at the end of this message and extract structured "
+                f"information using the extract_structured_data tool.\n\n{instructions}",
+                truncated_content,
+            )
 
             for attempt in range(3):
                 try:
@@ -178,8 +195,8 @@ CONTENT TO ANALYZE:
                         max_tokens=2000,
                         temperature=0.1,
                         tools=[extraction_tool],
-                        tool_choice={"type": "tool", "name": "extract_structured_data"},
-                        messages=[{"role": "user", "content": user_message}],
+                        tool_choice=_EXTRACTION_TOOL_CHOICE,
+                        messages=[{"role": "user", "content": user_content}],
                     )
 
                     # Extract tool use result
@@ -214,28 +231,23 @@ CONTENT TO ANALYZE:
             else:
                 prompt = custom_prompt or self._get_improved_prompt(schema)
 
-            # Truncate content if needed
-            truncated_content = content[: self.max_content_length]
-            if len(content) > self.max_content_length:
-                logger.info(
-                    f"Content truncated from {len(content)} to {self.max_content_length} characters"
-                )
-
-            user_message = f"""Analyze the following content and extract structured information.
-
-CONTENT TO ANALYZE:
-{truncated_content}
+            truncated_content = self._truncate_content(content)
 
-EXTRACTION INSTRUCTIONS:
-{prompt}
-
-Return the result as valid JSON starting immediately with {{ and ending with }}."""
+            user_content = self._cacheable_user_content(
+                "Analyze the content at the end of this message and extract structured "
+                f"information.\n\nEXTRACTION INSTRUCTIONS:\n{prompt}\n\n"
+                "Return the result as valid JSON starting immediately with { and ending with }.",
+                truncated_content,
+            )
 
             for attempt in range(3):
                 try:
                     logger.info(f"Anthropic prompt-based generation attempt {attempt + 1}/3")
 
-                    system_msg = "You are an expert content analyzer. Extract structured information and return valid JSON only."
+                    system_msg = (
+                        "You are an expert content analyzer. "
+                        "Extract structured information and return valid JSON only."
+                    )
 
                     # Use response prefilling to force JSON output
                     response = self._client.messages.create(
@@ -244,7 +256,7 @@ Return the result as valid JSON starting immediately with {{ and ending with }}.
                         temperature=0.1,
                         system=system_msg,
                         messages=[
-                            {"role": "user", "content": user_message},
+                            {"role": "user", "content": user_content},
                             {"role": "assistant", "content": "{"},  # Prefill with opening brace
                         ],
                     )
@@ -265,24 +277,23 @@ Return the result as valid JSON starting immediately with {{ and ending with }}.
 
                 except Exception as e:
                     logger.error(f"Anthropic generation failed (attempt {attempt + 1}): {e}")
-                    error_str = str(e).lower()
+                    match = _ERROR_CATEGORY.match(str(e))
+                    category = match.lastgroup if match else None
 
-                    if "rate" in error_str and "limit" in error_str:
+                    if category == "rate":
                         raise RateLimitError(
                             "Anthropic rate limit exceeded",
                             limit_type="api_requests",
                             provider="anthropic",
                             original_error=e,
                         )
-                    elif "authentication" in error_str or "api_key" in error_str:
+                    elif category == "auth":
                         raise AuthenticationError(
                             "Anthropic authentication failed",
                             provider="anthropic",
                             original_error=e,
                         )
-                    elif "model" in error_str and (
-                        "not found" in error_str or "invalid" in error_str
-                    ):
+                    elif category == "model":
                         raise ModelNotAvailableError(
                             "Anthropic model not available",
                             requested_model=self.model_name,
@@ -310,6 +321,18 @@ Return the result as valid JSON starting immediately with {{ and ending with }}.
                 ["Check Anthropic API key", "Verify model availability", "Check account credits"],
             )
 
+    @staticmethod
+    def _cacheable_user_content(instructions: str, content: str) -> List[Dict[str, Any]]:
+        """Build user message blocks with the static instructions before the page content.
+
+        The instructions block is marked as a prompt cache breakpoint, so the tools,
+        system prompt and instructions form a prefix that repeated requests can reuse.
+        """
+        return [
+            {"type": "text", "text": instructions, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": f"CONTENT TO ANALYZE:\n{content}"},
+        ]
+
     def summarize_content(self, content: str, max_length: int = 200) -> str:
         """Generate a brief summary using Anthropic Claude."""
         try:
@@ -321,11 +344,7 @@ Return the result as valid JSON starting immediately with {{ and ending with }}.
                 messages=[
                     {
                         "role": "user",
-                        "content": (
-                            f"Provide a clear, concise summary of this content in no "
-                            f"more than {max_length} characters. Focus on the main "
-                            f"points and key takeaways.\n\nContent: {content[:2000]}"
-                        ),
+                        "content": self._compose_summary_prompt(content, max_length),
                     }
                 ],
             )
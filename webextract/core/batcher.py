@@ -0,0 +1,64 @@
+"""Coalescing of concurrent identical LLM requests."""
+
+import copy
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, TypeVar
+
+from .cache import LLMCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LLMBatcher:
+    """Share one provider call between concurrent identical LLM requests.
+
+    The first caller for a request runs it; callers that arrive with the same
+    request while it is in flight wait for that result instead of paying for
+    another call. Each waiter receives its own copy of the result.
+    """
+
+    def __init__(self):
+        """Initialize the batcher with no requests in flight."""
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def run(self, call: Callable[[], T], **request: Any) -> T:
+        """Run call once for all concurrent callers with an identical request.
+
+        Args:
+            call: Zero-argument callable performing the LLM request
+            **request: Fields identifying the request (content, prompt, schema, ...)
+
+        Returns:
+            The result of call, shared between coalesced callers
+        """
+        key = LLMCache.make_key(**request)
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            logger.debug("Waiting for identical in-flight LLM request")
+            return copy.deepcopy(future.result())
+
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(copy.deepcopy(result))
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
@@ -0,0 +1,185 @@
+"""Cache for deterministic LLM extraction results."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".webextract" / "cache"
+
+
+class LLMCache:
+    """Cache of LLM results keyed by a SHA-256 hash of the request.
+
+    Entries live in an LRU-bounded in-memory map and, when a directory is
+    given, are also persisted as one JSON file per key so repeated runs can
+    reuse them.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_entries: int = 1024):
+        """Initialize the cache with an optional on-disk directory."""
+        self.directory = Path(directory) if directory else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**fields: Any) -> str:
+        """Build a stable cache key from the request fields."""
+        payload = json.dumps(fields, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        if entry is None and self.directory is not None:
+            entry = self._read_entry(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.time():
+                with self._lock:
+                    self.hits += 1
+                return value
+            self.delete(key)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, expiring after ttl seconds if given."""
+        entry = (time.time() + ttl if ttl else None, value)
+        self._remember(key, entry)
+
+        if self.directory is not None:
+            try:
+                self._write_entry(key, entry)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Failed to persist LLM cache entry: {e}")
+
+    def delete(self, key: str) -> None:
+        """Remove key from the cache."""
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.directory is not None:
+            try:
+                self._path_for(key).unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.directory is not None and self.directory.exists():
+            for path in self.directory.glob("*/*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of in-memory entries."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._memory)}
+
+    def disk_usage(self) -> Dict[str, int]:
+        """Return the number of on-disk entries and their total size in bytes."""
+        entries = 0
+        size = 0
+        if self.directory is not None and self.directory.exists():
+            for path in self.directory.glob("*/*.json"):
+                try:
+                    size += path.stat().st_size
+                except OSError:
+                    continue
+                entries += 1
+        return {"entries": entries, "bytes": size}
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        """Store an entry in memory, evicting the least recently used."""
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path_for(self, key: str) -> Path:
+        """Get the on-disk path for a key."""
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_entry(self, key: str) -> Optional[tuple]:
+        """Read an entry from disk."""
+        try:
+            with open(self._path_for(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data["expires_at"], data["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_entry(self, key: str, entry: tuple) -> None:
+        """Write an entry to disk atomically."""
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so concurrent writes of one key cannot collide
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            try:
+                json.dump({"expires_at": entry[0], "value": entry[1]}, f)
+            except BaseException:
+                f.close()
+                os.unlink(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+
+
+# Shared caches per backend so hit/miss counters cover the whole process
+_caches: Dict[str, LLMCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(backend: Optional[str]) -> Optional[LLMCache]:
+    """Return the shared cache for a backend name.
+
+    Args:
+        backend: ``"memory"``, ``"disk"`` (``~/.webextract/cache``), a directory
+            path, or None to disable caching
+
+    Returns:
+        LLMCache instance, or None when caching is disabled
+    """
+    if not backend:
+        return None
+
+    with _caches_lock:
+        cache = _caches.get(backend)
+        if cache is None:
+            if backend == "memory":
+                cache = LLMCache()
+            elif backend == "disk":
+                cache = LLMCache(DEFAULT_CACHE_DIR)
+            else:
+                cache = LLMCache(Path(backend).expanduser())
+            _caches[backend] = cache
+        return cache
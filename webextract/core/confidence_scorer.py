@@ -1,15 +1,32 @@
 """Configurable confidence scoring system for extraction quality assessment."""
 
 import logging
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from math import fsum
+from operator import mul
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+from .._compat import DATACLASS_OPTIONS
 from .models import ExtractedContent
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Default (threshold, score) pairs for content length scoring
+DEFAULT_CONTENT_LENGTH_THRESHOLDS: Tuple[Tuple[int, float], ...] = (
+    (1000, 0.2),  # High quality: substantial content
+    (500, 0.15),  # Good quality: decent content
+    (200, 0.1),  # Fair quality: minimal content
+    (100, 0.05),  # Low quality: very short content
+)
+
+# Error flags in structured data; they never count as populated fields
+_EXCLUDED_FIELDS = frozenset(("error", "extraction_error"))
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ConfidenceConfig:
     """Configuration for confidence scoring algorithm."""
 
@@ -18,15 +35,9 @@ class ConfidenceConfig:
     title_weight: float = 0.1
     description_weight: float = 0.05
 
-    # Content length scoring
-    content_length_thresholds: Dict[int, float] = field(
-        default_factory=lambda: {
-            1000: 0.2,  # High quality: substantial content
-            500: 0.15,  # Good quality: decent content
-            200: 0.1,  # Fair quality: minimal content
-            100: 0.05,  # Low quality: very short content
-        }
-    )
+    # Content length scoring: (threshold, score) pairs; a {threshold: score}
+    # mapping is accepted too and stored as pairs
+    content_length_thresholds: Tuple[Tuple[int, float], ...] = DEFAULT_CONTENT_LENGTH_THRESHOLDS
 
     # Structured data scoring
     structured_data_weight: float = 0.2
@@ -45,6 +56,25 @@ class ConfidenceConfig:
     max_score: float = 1.0
     min_score: float = 0.0
 
+    # Ascending thresholds and their scores, with 0.0 prepended for lengths
+    # below every threshold, so a bisect index maps straight to a score
+    _asc_thresholds: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _asc_scores: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Store thresholds as pairs so the config stays hashable, and index them."""
+        thresholds = self.content_length_thresholds
+        if isinstance(thresholds, Mapping):
+            thresholds = thresholds.items()
+        if not isinstance(thresholds, tuple):
+            thresholds = tuple(map(tuple, thresholds))
+            object.__setattr__(self, "content_length_thresholds", thresholds)
+
+        scores = dict(thresholds)
+        asc_thresholds = tuple(sorted(scores))
+        object.__setattr__(self, "_asc_thresholds", asc_thresholds)
+        object.__setattr__(self, "_asc_scores", (0.0,) + tuple(scores[t] for t in asc_thresholds))
+
 
 class ConfidenceScorer:
     """Configurable confidence scorer with evidence-based scoring."""
@@ -52,6 +82,31 @@ class ConfidenceScorer:
     def __init__(self, config: Optional[ConfidenceConfig] = None):
         self.config = config or ConfidenceConfig()
 
+    @property
+    def config(self) -> ConfidenceConfig:
+        """Scoring configuration; assigning a new one rebinds the cached weights."""
+        return self._config
+
+    @config.setter
+    def config(self, config: ConfidenceConfig) -> None:
+        self._config = config
+        self._base_score = config.base_extraction_score
+        self._title_w = config.title_weight
+        self._description_w = config.description_weight
+        self._thresholds = config._asc_thresholds
+        self._threshold_scores = config._asc_scores
+        self._structured_w = config.structured_data_weight
+        self._summary_w = config.summary_weight
+        self._summary_min_length = config.summary_min_length
+        self._topics_w = config.topics_weight
+        self._entities_w = config.entities_weight
+        self._rich_data_w = config.rich_data_weight
+        self._rich_data_threshold = config.rich_data_threshold
+        self._error_penalty = config.error_penalty
+        self._empty_content_penalty = config.empty_content_penalty
+        self._max_score = config.max_score
+        self._min_score = config.min_score
+
     def calculate_confidence(
         self, content: ExtractedContent, structured_info: Dict[str, Any]
     ) -> float:
@@ -63,132 +118,135 @@ class ConfidenceScorer:
             structured_info: LLM-generated structured data
 
         Returns:
-            Confidence score between 0.0 and 1.0
+            Confidence score between 0.0 and 1.0. Missing inputs and malformed
+            structured values score the minimum instead of raising.
         """
-        try:
-            # Initialize scoring breakdown for transparency
-            breakdown = {
-                "base_score": 0.0,
-                "content_quality": 0.0,
-                "structured_quality": 0.0,
-                "penalties": 0.0,
-            }
+        if content is None or structured_info is None:
+            return self._min_score
 
-            # Base score for successful extraction
-            breakdown["base_score"] = self.config.base_extraction_score
+        # Main content is measured once and shared by the length score and penalty
+        main_content = content.main_content or ""
+        content_length = len(main_content)
 
-            # Content quality scoring
-            breakdown["content_quality"] = self._score_content_quality(content)
+        # Base score for successful extraction
+        base_score = self._base_score
 
-            # Structured data quality scoring
-            breakdown["structured_quality"] = self._score_structured_data(structured_info)
+        # Content quality scoring
+        content_quality = self._score_content_quality(content, content_length)
 
-            # Apply penalties for errors or poor quality
-            breakdown["penalties"] = self._calculate_penalties(content, structured_info)
+        # Structured data quality scoring; LLM output may hold values of any type
+        try:
+            structured_quality, has_error = self._score_structured_data(structured_info)
+        except (AttributeError, TypeError) as e:
+            logger.warning(f"Error calculating confidence: {e}")
+            return self._min_score
 
-            # Calculate final score
-            total_score = sum(breakdown.values())
-            final_score = max(self.config.min_score, min(self.config.max_score, total_score))
+        # Apply penalties for errors or poor quality
+        penalties = self._calculate_penalties(main_content, content_length, has_error)
 
-            # Log scoring breakdown for transparency
-            logger.debug(f"Confidence breakdown: {breakdown}, final: {final_score:.3f}")
+        # Calculate final score
+        total_score = base_score + content_quality + structured_quality + penalties
+        final_score = max(self._min_score, min(self._max_score, total_score))
 
-            return final_score
+        # Log scoring breakdown for transparency, only when it will be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            breakdown = {
+                "base_score": base_score,
+                "content_quality": content_quality,
+                "structured_quality": structured_quality,
+                "penalties": penalties,
+            }
+            logger.debug("Confidence breakdown: %s, final: %.3f", breakdown, final_score)
 
-        except Exception as e:
-            logger.warning(f"Error calculating confidence: {e}")
-            return self.config.min_score
+        return final_score
+
+    def score_batch(self, items: Iterable[Tuple[ExtractedContent, Dict[str, Any]]]) -> List[float]:
+        """
+        Calculate confidence scores for many extractions.
+
+        Args:
+            items: (content, structured_info) pairs
+
+        Returns:
+            Confidence scores in input order
+        """
+        calculate = self.calculate_confidence
+        return [calculate(content, structured_info) for content, structured_info in items]
 
-    def _score_content_quality(self, content: ExtractedContent) -> float:
+    def _score_content_quality(self, content: ExtractedContent, content_length: int) -> float:
         """Score content quality based on title, description, and content length."""
         score = 0.0
 
         # Title presence
-        if content.title and content.title.strip():
-            score += self.config.title_weight
+        if self._title_w and content.title and content.title.strip():
+            score += self._title_w
 
         # Description presence
-        if content.description and content.description.strip():
-            score += self.config.description_weight
+        if self._description_w and content.description and content.description.strip():
+            score += self._description_w
 
-        # Content length scoring with configurable thresholds
-        content_length = len(content.main_content) if content.main_content else 0
-        length_score = self._score_content_length(content_length)
-        score += length_score
+        # Content length scoring: the score of the highest threshold the length meets
+        score += self._threshold_scores[bisect_right(self._thresholds, content_length)]
 
         return score
 
-    def _score_content_length(self, length: int) -> float:
-        """Score content based on length with configurable thresholds."""
-        # Sort thresholds in descending order
-        sorted_thresholds = sorted(
-            self.config.content_length_thresholds.items(), key=lambda x: x[0], reverse=True
-        )
-
-        # Find the first threshold that the content length meets
-        for threshold, score in sorted_thresholds:
-            if length >= threshold:
-                return score
+    def _score_structured_data(self, structured_info: Dict[str, Any]) -> Tuple[float, bool]:
+        """Score structured data quality.
 
-        return 0.0  # Below all thresholds
-
-    def _score_structured_data(self, structured_info: Dict[str, Any]) -> float:
-        """Score structured data quality."""
-        if not structured_info:
-            return 0.0
-
-        score = 0.0
+        Returns:
+            Tuple of (score, whether the data flags an extraction error); the
+            error flag is looked up once here and reused for the penalty.
+        """
+        has_error = bool(structured_info.get("error") or structured_info.get("extraction_error"))
 
-        # Check for extraction errors first
-        if structured_info.get("error") or structured_info.get("extraction_error"):
-            return 0.0  # No score for failed extractions
+        # No score for empty or failed extractions
+        if has_error or not structured_info:
+            return 0.0, has_error
 
         # Base score for successful structured extraction
-        score += self.config.structured_data_weight
+        score = self._structured_w
+
+        # Checks for dimensions weighted at zero are skipped entirely
 
         # Summary quality
-        summary = structured_info.get("summary", "")
-        if summary and len(summary) >= self.config.summary_min_length:
-            score += self.config.summary_weight
+        if self._summary_w:
+            summary = structured_info.get("summary", "")
+            if summary and len(summary) >= self._summary_min_length:
+                score += self._summary_w
 
         # Topics presence
-        topics = structured_info.get("topics", [])
-        if topics and len(topics) > 0:
-            score += self.config.topics_weight
+        if self._topics_w:
+            topics = structured_info.get("topics", [])
+            if topics and len(topics) > 0:
+                score += self._topics_w
 
         # Entities scoring
-        entities = structured_info.get("entities", {})
-        if self._has_meaningful_entities(entities):
-            score += self.config.entities_weight
+        if self._entities_w and self._has_meaningful_entities(structured_info.get("entities", {})):
+            score += self._entities_w
 
         # Rich data bonus (multiple fields populated)
-        populated_fields = self._count_populated_fields(structured_info)
-        if populated_fields >= self.config.rich_data_threshold:
-            score += self.config.rich_data_weight
+        if (
+            self._rich_data_w
+            and self._count_populated_fields(structured_info) >= self._rich_data_threshold
+        ):
+            score += self._rich_data_w
 
-        return score
+        return score, False
 
     def _has_meaningful_entities(self, entities: Any) -> bool:
-        """Check if entities contain meaningful data."""
-        if not isinstance(entities, dict):
-            return False
-
-        total_entities = 0
-        for value in entities.values():
-            if isinstance(value, list):
-                total_entities += len(value)
-            elif value:  # Non-empty value
-                total_entities += 1
+        """Check if entities contain meaningful data.
 
-        return total_entities > 0
+        A non-empty list or any other truthy value counts as an entity, which is
+        exactly the truthiness of each value, so the first hit settles it.
+        """
+        return isinstance(entities, dict) and any(entities.values())
 
     def _count_populated_fields(self, structured_info: Dict[str, Any]) -> int:
         """Count populated fields in structured data."""
-        excluded_fields = {"error", "extraction_error"}
         count = 0
 
         for key, value in structured_info.items():
-            if key in excluded_fields:
+            if key in _EXCLUDED_FIELDS:
                 continue
 
             # Check if field has meaningful content
@@ -211,77 +269,154 @@ class ConfidenceScorer:
         return bool(value)
 
     def _calculate_penalties(
-        self, content: ExtractedContent, structured_info: Dict[str, Any]
+        self, main_content: str, content_length: int, has_error: bool
     ) -> float:
         """Calculate penalties for poor quality indicators."""
         penalties = 0.0
 
         # Error penalties
-        if structured_info.get("error") or structured_info.get("extraction_error"):
-            penalties += self.config.error_penalty
+        if has_error:
+            penalties += self._error_penalty
 
-        # Empty or very short content penalty
-        if not content.main_content or len(content.main_content.strip()) < 50:
-            penalties += self.config.empty_content_penalty
+        # Empty or very short content penalty; stripping can only shorten the
+        # text, so short content needs no strip at all
+        if content_length < 50 or len(main_content.strip()) < 50:
+            penalties += self._empty_content_penalty
 
         return penalties
 
 
 class AdaptiveConfidenceScorer(ConfidenceScorer):
-    """Adaptive confidence scorer that learns from feedback."""
+    """Adaptive confidence scorer that learns from feedback.
+
+    The most recent feedback is kept in fixed-size ring buffers of floats, so
+    recording feedback never allocates or copies once the buffers are full.
+    Running sums over the buffers are updated on every add, which makes the
+    statistics O(1); they are recomputed exactly each time the buffers wrap
+    so rounding from evictions cannot accumulate.
+    """
+
+    history_size = 100
 
     def __init__(self, config: Optional[ConfidenceConfig] = None):
         super().__init__(config)
-        self.feedback_history = []
-
-    def add_feedback(self, predicted_confidence: float, actual_quality: float):
-        """Add feedback to improve scoring accuracy."""
-        self.feedback_history.append(
+        self._predicted = array("d", bytes(8 * self.history_size))
+        self._actual = array("d", bytes(8 * self.history_size))
+        self._errors = array("d", bytes(8 * self.history_size))
+        self._head = 0
+        self._size = 0
+        self._resync_sums()
+
+    @property
+    def feedback_history(self) -> List[Dict[str, float]]:
+        """Recorded feedback, oldest first."""
+        start = self._head - self._size
+        return [
             {
-                "predicted": predicted_confidence,
-                "actual": actual_quality,
-                "error": abs(predicted_confidence - actual_quality),
+                "predicted": self._predicted[i],
+                "actual": self._actual[i],
+                "error": self._errors[i],
             }
-        )
+            for i in (j % self.history_size for j in range(start, self._head))
+        ]
+
+    @feedback_history.setter
+    def feedback_history(self, entries: Iterable[Dict[str, float]]) -> None:
+        """Replace the recorded feedback, keeping the most recent entries."""
+        self._head = 0
+        self._size = 0
+        self._resync_sums()
+        for entry in list(entries)[-self.history_size :]:
+            self.add_feedback(entry["predicted"], entry["actual"])
 
-        # Keep only recent feedback (last 100 entries)
-        if len(self.feedback_history) > 100:
-            self.feedback_history = self.feedback_history[-100:]
+    def add_feedback(self, predicted_confidence: float, actual_quality: float):
+        """Add feedback to improve scoring accuracy."""
+        head = self._head
+        error = abs(predicted_confidence - actual_quality)
+
+        # Drop the entry about to be overwritten from the running sums
+        if self._size == self.history_size:
+            old_p, old_a = self._predicted[head], self._actual[head]
+            self._sum_p -= old_p
+            self._sum_a -= old_a
+            self._sum_pa -= old_p * old_a
+            self._sum_p2 -= old_p * old_p
+            self._sum_a2 -= old_a * old_a
+            self._sum_error -= self._errors[head]
+        else:
+            self._size += 1
+
+        self._predicted[head] = predicted_confidence
+        self._actual[head] = actual_quality
+        self._errors[head] = error
+        self._sum_p += predicted_confidence
+        self._sum_a += actual_quality
+        self._sum_pa += predicted_confidence * actual_quality
+        self._sum_p2 += predicted_confidence * predicted_confidence
+        self._sum_a2 += actual_quality * actual_quality
+        self._sum_error += error
+
+        # Overwrite the oldest entry once the buffers are full
+        self._head = (head + 1) % self.history_size
+        if self._head == 0:
+            self._resync_sums()
 
     def get_average_error(self) -> float:
         """Get average prediction error from feedback."""
-        if not self.feedback_history:
+        if not self._size:
             return 0.0
 
-        total_error = sum(item["error"] for item in self.feedback_history)
-        return total_error / len(self.feedback_history)
+        return self._sum_error / self._size
 
     def get_calibration_stats(self) -> Dict[str, float]:
         """Get calibration statistics."""
-        if not self.feedback_history:
+        if not self._size:
             return {}
 
-        predictions = [item["predicted"] for item in self.feedback_history]
-        actuals = [item["actual"] for item in self.feedback_history]
-
+        n = self._size
         return {
-            "mean_predicted": sum(predictions) / len(predictions),
-            "mean_actual": sum(actuals) / len(actuals),
-            "mean_error": self.get_average_error(),
-            "correlation": self._calculate_correlation(predictions, actuals),
+            "mean_predicted": self._sum_p / n,
+            "mean_actual": self._sum_a / n,
+            "mean_error": self._sum_error / n,
+            "correlation": self._correlation_from_sums(
+                n, self._sum_p, self._sum_a, self._sum_pa, self._sum_p2, self._sum_a2
+            ),
         }
 
-    def _calculate_correlation(self, x: list, y: list) -> float:
+    def _resync_sums(self) -> None:
+        """Recompute the running sums exactly from the filled part of the buffers."""
+        # Order does not matter for these sums, only that pairs line up
+        n = self._size
+        predictions = self._predicted[:n]
+        actuals = self._actual[:n]
+        self._sum_p = fsum(predictions)
+        self._sum_a = fsum(actuals)
+        self._sum_pa = fsum(map(mul, predictions, actuals))
+        self._sum_p2 = fsum(map(mul, predictions, predictions))
+        self._sum_a2 = fsum(map(mul, actuals, actuals))
+        self._sum_error = fsum(self._errors[:n])
+
+    def _calculate_correlation(self, x: Sequence[float], y: Sequence[float]) -> float:
         """Calculate correlation between predicted and actual scores."""
-        if len(x) != len(y) or len(x) < 2:
+        if len(x) != len(y):
             return 0.0
 
-        n = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(x[i] * y[i] for i in range(n))
-        sum_x2 = sum(x[i] ** 2 for i in range(n))
-        sum_y2 = sum(y[i] ** 2 for i in range(n))
+        return self._correlation_from_sums(
+            len(x),
+            fsum(x),
+            fsum(y),
+            fsum(map(mul, x, y)),
+            fsum(map(mul, x, x)),
+            fsum(map(mul, y, y)),
+        )
+
+    @staticmethod
+    def _correlation_from_sums(
+        n: int, sum_x: float, sum_y: float, sum_xy: float, sum_x2: float, sum_y2: float
+    ) -> float:
+        """Pearson correlation from the count and sums of x, y, xy, x^2 and y^2."""
+        if n < 2:
+            return 0.0
 
         numerator = n * sum_xy - sum_x * sum_y
         denominator = ((n * sum_x2 - sum_x**2) * (n * sum_y2 - sum_y**2)) ** 0.5
@@ -1,11 +1,21 @@
 """Main data extraction logic combining scraping and LLM processing."""
 
+import asyncio
+import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from dataclasses import replace
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from functools import lru_cache, partial
+from typing import Dict, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
 from ..config import WebExtractConfig, get_default_config
+from .batcher import LLMBatcher
+from .cache import LLMCache, get_llm_cache
 from .confidence_scorer import ConfidenceConfig, ConfidenceScorer
 from .exceptions import ConfigurationError, ExtractionError, LLMError, ScrapingError
 from .llm_factory import create_llm_client
@@ -14,6 +24,18 @@ from .scraper import WebScraper
 
 logger = logging.getLogger(__name__)
 
+# urlparse is pure; retries and batch runs re-validate the same URLs
+_parse_url = lru_cache(maxsize=1024)(urlparse)
+
+# Extraction result cache: LRU-bounded, and only a fraction p of eligible
+# results is stored (spread evenly via an accumulator) to bound memory.
+_CACHE_MAX_SIZE = 256
+_CACHE_MIN_CONFIDENCE = 0.3
+_CACHE_PROBABILITY = min(1.0, max(0.0, float(os.getenv("WEBEXTRACT_CACHE_P", "1.0"))))
+
+# Providers billed per request, where coalescing duplicate calls saves cost
+_BATCHED_PROVIDERS = frozenset({"openai", "anthropic"})
+
 
 class DataExtractor:
     """Main class for extracting structured data from web pages."""
@@ -48,24 +70,41 @@ class DataExtractor:
             logger.error(f"Failed to create LLM client: {e}")
             raise e
 
-        self._extraction_cache = {}  # Simple cache for repeated URLs
+        self._extraction_cache = OrderedDict()  # LRU cache for repeated URLs
+        self._cache_lock = threading.Lock()
+        self._cache_accumulator = 0.0
+
+        # Per-thread scraper kept open by session()
+        self._session = threading.local()
+
+        # Concurrent identical requests to paid providers share one call
+        self._llm_batcher = LLMBatcher() if self.config.llm.provider in _BATCHED_PROVIDERS else None
+
+        # Optional persistent cache for deterministic LLM results
+        self.llm_cache = get_llm_cache(self.config.llm.cache_backend)
 
     def _convert_legacy_config(self, legacy_config: ExtractionConfig) -> WebExtractConfig:
         """Convert legacy ExtractionConfig to WebExtractConfig."""
-        # Get default config and update with legacy values
+        # Derive from the default config without modifying the shared instance
         config = get_default_config()
+        llm_overrides = {}
+        scraping_overrides = {}
 
         # Map legacy fields to new config structure
-        if hasattr(legacy_config, "model_name") and legacy_config.model_name:
-            config.llm.model_name = legacy_config.model_name
+        if getattr(legacy_config, "model_name", None):
+            llm_overrides["model_name"] = legacy_config.model_name
 
-        if hasattr(legacy_config, "max_content_length") and legacy_config.max_content_length:
-            config.scraping.max_content_length = legacy_config.max_content_length
+        if getattr(legacy_config, "max_content_length", None):
+            scraping_overrides["max_content_length"] = legacy_config.max_content_length
 
-        if hasattr(legacy_config, "custom_prompt") and legacy_config.custom_prompt:
-            config.llm.custom_prompt = legacy_config.custom_prompt
+        if getattr(legacy_config, "custom_prompt", None):
+            llm_overrides["custom_prompt"] = legacy_config.custom_prompt
 
-        return config
+        return replace(
+            config,
+            llm=replace(config.llm, **llm_overrides),
+            scraping=replace(config.scraping, **scraping_overrides),
+        )
 
     def extract(
         self,
@@ -91,9 +130,22 @@ class DataExtractor:
                 raise ExtractionError(f"Invalid URL format: {url}")
 
             # Check cache unless force refresh
-            if not force_refresh and url in self._extraction_cache:
-                logger.info(f"Returning cached result for: {url}")
-                return self._extraction_cache[url]
+            cache_key = self._cache_key(url, schema)
+            if not force_refresh:
+                cached = self._get_cached(cache_key)
+                if cached is not None:
+                    logger.info(f"Returning cached result for: {url}")
+                    return cached
+
+            # Check the LLM result cache for deterministic configurations
+            llm_cache_key = self._llm_cache_key(url, schema)
+            if llm_cache_key and not force_refresh:
+                cached_data = self.llm_cache.get(llm_cache_key)
+                if cached_data is not None:
+                    logger.info(f"Returning LLM cache hit for: {url}")
+                    result = StructuredData.model_validate(cached_data)
+                    self._store_cached(cache_key, result)
+                    return result
 
             # Check model availability
             try:
@@ -134,8 +186,10 @@ class DataExtractor:
             )
 
             # Cache successful results
-            if confidence > 0.3:  # Only cache decent results
-                self._extraction_cache[url] = result
+            if confidence > _CACHE_MIN_CONFIDENCE:  # Only cache decent results
+                self._store_cached(cache_key, result)
+                if llm_cache_key and result.is_successful:
+                    self.llm_cache.set(llm_cache_key, result.model_dump(mode="json"))
 
             logger.info(f"Extraction completed for {url} with confidence: {confidence:.2f}")
             return result
@@ -164,24 +218,91 @@ class DataExtractor:
         Returns:
             List of StructuredData objects (None for failed extractions)
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import ThreadPoolExecutor
 
         results = [None] * len(urls)
+        pending = iter(range(len(urls)))
+        pending_lock = threading.Lock()
+
+        workers = max(1, min(max_workers, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._drain_batch, urls, schema, results, pending, pending_lock)
+                for _ in range(workers)
+            ]
+            for future in futures:
+                future.result()
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(self.extract, url, schema): i for i, url in enumerate(urls)
-            }
+        return results
+
+    async def aextract(
+        self,
+        url: str,
+        schema: Optional[Dict[str, str]] = None,
+        force_refresh: bool = False,
+    ) -> Optional[StructuredData]:
+        """Asynchronous variant of :meth:`extract`.
+
+        Scraping and the LLM clients are blocking, so the extraction runs in the
+        event loop's default executor and the loop stays free for other work.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.extract, url, schema, force_refresh))
+
+    async def aextract_batch(
+        self,
+        urls: List[str],
+        schema: Optional[Dict[str, str]] = None,
+        concurrency: int = 8,
+    ) -> List[Optional[StructuredData]]:
+        """
+        Extract data from multiple URLs concurrently with asyncio.
 
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
+        Args:
+            urls: List of URLs to extract from
+            schema: Optional schema for extraction
+            concurrency: Number of extraction lanes, each with its own browser
+
+        Returns:
+            List of StructuredData objects in input order (None for failed extractions)
+        """
+        results = [None] * len(urls)
+        pending = iter(range(len(urls)))
+        pending_lock = threading.Lock()
+
+        # Independent lanes, each with its own browser, pull from a shared queue
+        loop = asyncio.get_running_loop()
+        lanes = max(1, min(concurrency, len(urls)))
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    None, self._drain_batch, urls, schema, results, pending, pending_lock
+                )
+                for _ in range(lanes)
+            )
+        )
+
+        return results
+
+    def _drain_batch(
+        self,
+        urls: List[str],
+        schema: Optional[Dict[str, str]],
+        results: List[Optional[StructuredData]],
+        pending: Iterator[int],
+        pending_lock: threading.Lock,
+    ) -> None:
+        """Extract queued URL indices on this thread, keeping one browser open."""
+        with self.session():
+            while True:
+                with pending_lock:
+                    index = next(pending, None)
+                if index is None:
+                    return
                 try:
-                    results[index] = future.result()
+                    results[index] = self.extract(urls[index], schema)
                 except Exception as e:
                     logger.error(f"Batch extraction error for index {index}: {e}")
-                    results[index] = None
-
-        return results
 
     def extract_with_custom_schema(
         self, url: str, extraction_schema: Dict[str, str]
@@ -230,19 +351,84 @@ class DataExtractor:
 
         return result
 
+    @staticmethod
+    def _cache_key(url: str, schema: Optional[Dict[str, str]]) -> tuple:
+        """Build the cache key for a URL and optional schema."""
+        if not schema:
+            return (url, None)
+        return (url, json.dumps(schema, sort_keys=True, default=str))
+
+    def _llm_cache_key(self, url: str, schema: Optional[Dict[str, str]]) -> Optional[str]:
+        """Build the LLM cache key, or None when caching is off or output is not deterministic."""
+        llm = self.config.llm
+        if self.llm_cache is None or llm.temperature != 0:
+            return None
+        return LLMCache.make_key(
+            url=url,
+            provider=llm.provider,
+            model=llm.model_name,
+            prompt=llm.custom_prompt,
+            schema=schema,
+            temperature=llm.temperature,
+            max_tokens=llm.max_tokens,
+            max_content_length=self.config.scraping.max_content_length,
+        )
+
+    def _get_cached(self, key: tuple) -> Optional[StructuredData]:
+        """Return a cached result and mark it as recently used."""
+        with self._cache_lock:
+            result = self._extraction_cache.get(key)
+            if result is not None:
+                self._extraction_cache.move_to_end(key)
+            return result
+
+    def _store_cached(self, key: tuple, result: StructuredData) -> None:
+        """Store a result with probability ``WEBEXTRACT_CACHE_P``, evicting LRU entries."""
+        with self._cache_lock:
+            self._cache_accumulator += _CACHE_PROBABILITY
+            if self._cache_accumulator < 1.0:
+                return
+            self._cache_accumulator -= 1.0
+
+            self._extraction_cache[key] = result
+            self._extraction_cache.move_to_end(key)
+            while len(self._extraction_cache) > _CACHE_MAX_SIZE:
+                self._extraction_cache.popitem(last=False)
+
     def _validate_url(self, url: str) -> bool:
         """Validate URL format."""
         try:
-            parsed = urlparse(url)
+            parsed = _parse_url(url)
             return bool(parsed.scheme and parsed.netloc)
         except Exception as e:
             logger.error(f"URL validation failed for {url}: {e}")
             return False
 
+    @contextmanager
+    def session(self):
+        """Reuse one browser for every extraction made on this thread inside the block.
+
+        Example:
+            with extractor.session():
+                results = [extractor.extract(url) for url in urls]
+        """
+        if getattr(self._session, "scraper", None) is not None:
+            yield self
+            return
+
+        with WebScraper(self.config) as scraper:
+            self._session.scraper = scraper
+            try:
+                yield self
+            finally:
+                self._session.scraper = None
+
     def _scrape_content(self, url: str) -> Optional[ExtractedContent]:
         """Scrape content from URL with error handling."""
         try:
-            with WebScraper(self.config) as scraper:
+            scraper = getattr(self._session, "scraper", None)
+            scope = nullcontext(scraper) if scraper is not None else WebScraper(self.config)
+            with scope as scraper:
                 content = scraper.scrape(url)
 
                 if content and len(content.main_content.strip()) < 50:
@@ -266,15 +452,24 @@ class DataExtractor:
             # Prepare content for LLM
             llm_content = self._prepare_content_for_llm(content)
 
+            custom_prompt = self.config.llm.custom_prompt
             if schema:
                 # Use custom schema
-                return self.llm_client.extract_with_schema(llm_content, schema)
+                call = partial(self.llm_client.extract_with_schema, llm_content, schema)
             else:
                 # Use default extraction
-                return self.llm_client.generate_structured_data(
-                    content=llm_content, custom_prompt=self.config.llm.custom_prompt
+                call = partial(
+                    self.llm_client.generate_structured_data,
+                    content=llm_content,
+                    custom_prompt=custom_prompt,
                 )
 
+            if self._llm_batcher is None:
+                return call()
+            return self._llm_batcher.run(
+                call, content=llm_content, prompt=None if schema else custom_prompt, schema=schema
+            )
+
         except LLMError:
             raise
         except Exception as e:
@@ -368,5 +563,7 @@ class DataExtractor:
 
     def clear_cache(self):
         """Clear the extraction cache."""
-        self._extraction_cache.clear()
+        with self._cache_lock:
+            self._extraction_cache.clear()
+            self._cache_accumulator = 0.0
         logger.info("Extraction cache cleared")
@@ -5,6 +5,13 @@ import logging
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,6 +66,12 @@ class JSONParser:
 
     def _try_direct_parse(self, text: str) -> Optional[Dict[str, Any]]:
         """Try direct JSON parsing."""
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                # orjson is stricter (no NaN/Infinity, 64-bit ints); let json decide
+                pass
         try:
             return json.loads(text)
         except json.JSONDecodeError:
@@ -1,10 +1,12 @@
 """Base LLM client and Ollama implementation for processing extracted content."""
 
+import asyncio
 import json
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional
 
 from ..config import get_default_config
 from .exceptions import AuthenticationError, ErrorHandler, LLMError, ModelNotAvailableError
@@ -17,6 +19,35 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Static part of the JSON extraction prompt. It is sent before the page
+# content so the prompt prefix is identical across pages and providers can
+# serve it from their prompt caches.
+_JSON_PROMPT_TEMPLATE = """\
+Analyze the content at the end of this message and return ONLY a valid JSON object.
+
+EXTRACTION INSTRUCTIONS:
+{instructions}
+
+CRITICAL RULES:
+1. Return ONLY the JSON object - no explanatory text before or after
+2. Start with {{ and end with }}
+3. Use double quotes for ALL strings (no single quotes)
+4. Ensure all required fields are present
+5. Use empty arrays [] for missing list data
+6. Use empty strings "" for missing text data
+7. Escape any quotes inside string values with \\"
+
+CONTENT TO ANALYZE:
+"""
+
+# Summary prompt shared by all providers; only the first part of the content is sent
+_SUMMARY_PROMPT_TEMPLATE = (
+    "Provide a clear, concise summary of this content in no more than {max_length} "
+    "characters. Focus on the main points and key takeaways.\n\nContent: {content}"
+)
+_OLLAMA_SUMMARY_PROMPT_TEMPLATE = _SUMMARY_PROMPT_TEMPLATE + "\n\nSummary (max {max_length} chars):"
+_SUMMARY_CONTENT_CHARS = 2000
+
 
 class BaseLLMClient(ABC):
     """Abstract base class for LLM clients."""
@@ -53,6 +84,70 @@ class BaseLLMClient(ABC):
         """Extract data according to a specific schema."""
         return self.generate_structured_data(content, schema=schema)
 
+    async def agenerate_structured_data(
+        self,
+        content: str,
+        custom_prompt: str = None,
+        schema: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """Asynchronous variant of :meth:`generate_structured_data`.
+
+        Provider SDK calls are blocking, so the request runs in the event loop's
+        default executor and the loop stays free for other work.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.generate_structured_data, content, custom_prompt, schema)
+        )
+
+    async def agenerate_batch(
+        self,
+        contents: List[str],
+        custom_prompt: str = None,
+        schema: Dict[str, Any] = None,
+        concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate structured data for multiple contents concurrently.
+
+        Args:
+            contents: List of content strings to process
+            custom_prompt: Optional custom prompt applied to every content
+            schema: Optional schema applied to every content
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of structured data dicts in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _generate(content: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.agenerate_structured_data(content, custom_prompt, schema)
+
+        return list(await asyncio.gather(*(_generate(content) for content in contents)))
+
+    @staticmethod
+    def _compose_json_prompt(instructions: str, content: str) -> str:
+        """Build the JSON extraction prompt with static instructions before the content."""
+        return _JSON_PROMPT_TEMPLATE.format(instructions=instructions) + content
+
+    @staticmethod
+    def _compose_summary_prompt(
+        content: str, max_length: int, template: str = _SUMMARY_PROMPT_TEMPLATE
+    ) -> str:
+        """Build the summary prompt from the leading part of the content."""
+        return template.format(max_length=max_length, content=content[:_SUMMARY_CONTENT_CHARS])
+
+    def _truncate_content(self, content: str) -> str:
+        """Cut content to max_content_length, returning it unsliced when it already fits."""
+        max_length = self.max_content_length
+        length = len(content)
+        if length <= max_length:
+            return content
+        logger.info(f"Content truncated from {length} to {max_length} characters")
+        return content[:max_length]
+
     def _get_improved_prompt(self, schema: Optional[Dict[str, Any]] = None) -> str:
         """Get improved prompt for reliable JSON generation."""
         return self.prompt_builder.create_extraction_prompt(schema=schema)
@@ -164,30 +259,9 @@ class OllamaClient(BaseLLMClient):
             else:
                 prompt = custom_prompt or self._get_improved_prompt(schema)
 
-            # Truncate content if needed
-            truncated_content = content[: self.max_content_length]
-            if len(content) > self.max_content_length:
-                logger.info(
-                    f"Content truncated from {len(content)} to "
-                    f"{self.max_content_length} characters"
-                )
-
-            full_prompt = f"""Analyze the following content and return ONLY a valid JSON object.
+            truncated_content = self._truncate_content(content)
 
-CONTENT TO ANALYZE:
-{truncated_content}
-
-EXTRACTION INSTRUCTIONS:
-{prompt}
-
-CRITICAL RULES:
-1. Return ONLY the JSON object - no explanatory text before or after
-2. Start with {{ and end with }}
-3. Use double quotes for ALL strings (no single quotes)
-4. Ensure all required fields are present
-5. Use empty arrays [] for missing list data
-6. Use empty strings "" for missing text data
-7. Escape any quotes inside string values with \\"""
+            full_prompt = self._compose_json_prompt(prompt, truncated_content)
 
             for attempt in range(self.config.llm.retry_attempts):
                 try:
@@ -259,11 +333,7 @@ CRITICAL RULES:
 
     def summarize_content(self, content: str, max_length: int = 200) -> str:
         """Generate a brief summary of the content using Ollama."""
-        prompt = (
-            f"Provide a clear, concise summary of this content in no more than "
-            f"{max_length} characters. Focus on the main points and key takeaways.\n\n"
-            f"Content: {content[:2000]}\n\nSummary (max {max_length} chars):"
-        )
+        prompt = self._compose_summary_prompt(content, max_length, _OLLAMA_SUMMARY_PROMPT_TEMPLATE)
 
         try:
             response = self.client.generate(
@@ -46,6 +46,11 @@ class ExtractedContent(BaseModel):
         """Get the length of main content."""
         return len(self.main_content)
 
+    @property
+    def link_count(self) -> int:
+        """Get the number of extracted links."""
+        return len(self.links)
+
     @property
     def has_metadata(self) -> bool:
         """Check if metadata is present."""
@@ -12,6 +12,12 @@ from .exceptions import (
 )
 from .llm_client import BaseLLMClient
 
+# Imported once with the module; the client raises LLMError when it is missing
+try:
+    import openai
+except ImportError:
+    openai = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,16 +34,15 @@ class OpenAIClient(BaseLLMClient):
 
     def _setup_client(self):
         """Set up the OpenAI client."""
-        try:
-            import openai
-
-            self._client = openai.OpenAI(api_key=self.api_key, base_url=self.base_url)
-        except ImportError:
+        if openai is None:
             raise LLMError(
                 "OpenAI package not installed",
                 provider="openai",
                 suggestions=["Install with: pip install openai"],
             )
+
+        try:
+            self._client = openai.OpenAI(api_key=self.api_key, base_url=self.base_url)
         except Exception as e:
             raise AuthenticationError(
                 "Failed to setup OpenAI client", provider="openai", original_error=e
@@ -73,13 +78,7 @@ class OpenAIClient(BaseLLMClient):
             else:
                 prompt = custom_prompt or self._get_improved_prompt()
 
-            # Truncate content if needed
-            truncated_content = content[: self.max_content_length]
-            if len(content) > self.max_content_length:
-                logger.info(
-                    f"Content truncated from {len(content)} to "
-                    f"{self.max_content_length} characters"
-                )
+            truncated_content = self._truncate_content(content)
 
             system_message = (
                 "You are an expert content analyzer. Extract structured "
@@ -88,22 +87,7 @@ class OpenAIClient(BaseLLMClient):
                 "JSON object."
             )
 
-            user_message = f"""Analyze the following content and return ONLY a valid JSON object.
-
-CONTENT TO ANALYZE:
-{truncated_content}
-
-EXTRACTION INSTRUCTIONS:
-{prompt}
-
-CRITICAL RULES:
-1. Return ONLY the JSON object - no explanatory text before or after
-2. Start with {{ and end with }}
-3. Use double quotes for ALL strings (no single quotes)
-4. Ensure all required fields are present
-5. Use empty arrays [] for missing list data
-6. Use empty strings "" for missing text data
-7. Escape any quotes inside string values with \\"""
+            user_message = self._compose_json_prompt(prompt, truncated_content)
 
             for attempt in range(3):  # OpenAI is more reliable, fewer retries needed
                 try:
@@ -188,11 +172,7 @@ CRITICAL RULES:
                     },
                     {
                         "role": "user",
-                        "content": (
-                            f"Provide a clear, concise summary of this content in "
-                            f"no more than {max_length} characters. Focus on the "
-                            f"main points and key takeaways.\n\nContent: {content[:2000]}"
-                        ),
+                        "content": self._compose_summary_prompt(content, max_length),
                     },
                 ],
                 temperature=0.3,
@@ -333,15 +333,25 @@ class ResourceManager:
         self.playwright = None
         self.browser = None
         self.context = None
+        self.keep_alive = False
 
     @contextmanager
     def browser_session(self):
-        """Context manager for browser session with guaranteed cleanup."""
+        """Context manager for browser session with guaranteed cleanup.
+
+        When ``keep_alive`` is set the browser stays open after the block so
+        later sessions reuse it; :meth:`close` releases it.
+        """
         try:
             self._setup_browser()
             yield self
         finally:
-            self._cleanup_browser()
+            if not self.keep_alive:
+                self._cleanup_browser()
+
+    def close(self):
+        """Release a browser kept open by ``keep_alive``."""
+        self._cleanup_browser()
 
     def _setup_browser(self):
         """Setup browser with proper error handling."""
@@ -571,8 +581,10 @@ class WebScraper(ImprovedWebScraper):
     """Backward compatible WebScraper using improved implementation."""
 
     def __enter__(self):
+        # Keep one browser open for every scrape() inside the with block
+        self.resource_manager.keep_alive = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Resource cleanup is handled automatically by context managers
-        pass
+        self.resource_manager.keep_alive = False
+        self.resource_manager.close()